@@ -1,7 +1,18 @@
 import asyncio
 import logging
-from datetime import datetime
+import random
+import re
+import time
+import traceback
+from collections import defaultdict
+from datetime import datetime, timezone, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
 from telegram import Update, BotCommand, InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardMarkup, KeyboardButton
+from telegram.error import BadRequest, Forbidden, NetworkError, RetryAfter, TimedOut
+from telegram.constants import ParseMode
 from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandler, filters, CallbackQueryHandler
 from telegram.request import HTTPXRequest
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -10,7 +21,7 @@ from apscheduler.triggers.cron import CronTrigger
 from config import TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, NEWS_CHECK_INTERVAL, STOCK_ALERT_TIMES, LOG_LEVEL, BOT_PASSWORD
 from database import Database
 from news_crawler import NaverNewsCrawler
-from stock_monitor import StockMonitor
+from stock_monitor import StockMonitor, format_scenario_lines
 
 # 로깅 설정
 logging.basicConfig(
@@ -22,6 +33,195 @@ logger = logging.getLogger(__name__)
 # httpx 로그만 숨김 (너무 많은 HTTP 요청 로그 방지)
 logging.getLogger('httpx').setLevel(logging.WARNING)
 
+# 한국 시간 (GMT+9) 및 요일 표기 (핫 루프에서 매번 재생성하지 않도록 모듈 레벨 상수)
+KST = timezone(timedelta(hours=9))
+WEEKDAY_KR = ('월', '화', '수', '목', '금', '토', '일')
+
+
+# 고정 안내 문구 (호출마다 f-string을 다시 조립하지 않도록 모듈 레벨에 1회 정의)
+WELCOME_MESSAGE = f"""🤖 <b>TeleNews 봇에 오신 것을 환영합니다!</b>
+
+📌 <b>자동 알림</b>
+• 뉴스: {NEWS_CHECK_INTERVAL}분마다 키워드 뉴스 자동 확인 후 메세지로 전송
+  * 이미 전송한 뉴스는 보내지 않음
+• 주가: 나스닥 100 전고점 대비 5%부터 1%p 단위로 하락시 알림
+
+💡 <b>사용 방법</b>
+하단 버튼을 클릭하여 시작
+"""
+
+ADD_KEYWORD_HELP = (
+    "📝 <b>추가할 키워드를 입력해주세요</b>\n\n"
+    "🔹 <b>단순 키워드</b>\n"
+    "예시: 단독, 속보, 삼성전자, AI, 나스닥\n"
+    "💡 콤마(,)로 구분하여 여러 개 동시 입력 가능\n\n"
+    "🔹 <b>논리 연산 (AND/OR)</b>\n"
+    "• <code>삼성 and 애플</code> - 삼성과 애플 모두 관련된 기사\n"
+    "• <code>삼성 or 애플</code> - 삼성 또는 애플 관련 기사\n"
+    "and 와 or은 혼합하여 사용 불가\n"
+)
+
+ADD_KEYWORD_HELP_FROM_LIST = (
+    "📝 <b>키워드 추가</b>\n\n"
+    "추가할 키워드를 입력해주세요.\n\n"
+    "🔹 <b>단순 키워드</b>\n"
+    "예시: 삼성전자, AI, 나스닥\n"
+    "💡 콤마(,)로 구분하여 여러 개 동시 입력 가능\n\n"
+    "🔹 <b>논리 연산 (AND/OR)</b>\n"
+    "• <code>삼성 and 애플</code> - 삼성과 애플 모두 관련된 뉴스\n"
+    "• <code>삼성 or 애플</code> - 삼성 또는 애플과 관련된 뉴스\n"
+    "and 와 or은 혼합하여 사용 불가\n"
+)
+
+# 메인 메뉴 키보드 (ReplyKeyboardMarkup도 불변이라 재사용 가능)
+MAIN_MENU_MARKUP = ReplyKeyboardMarkup(
+    [
+        [KeyboardButton("📋 키워드 목록"), KeyboardButton("📰 즉시 뉴스 확인")],
+        [KeyboardButton("📊 주가 정보"), KeyboardButton("🔕 방해금지 설정")],
+    ],
+    resize_keyboard=True,
+)
+
+
+# 주가 하락 알림 메시지 템플릿 (사용자마다 f-string을 다시 조립하지 않도록 모듈 레벨에 1회 정의)
+DROP_ALERT_TEMPLATE = """🚨 <b>나스닥 100 하락 알림</b> 🚨
+
+<b>⚠️ 전고점 대비 {drop_level}% 하락!</b>
+
+<b>나스닥 100 (^NDX)</b>
+• 전날 장중 최저가: ${current_price:,.2f} ({low_time_str})
+• 전고점: ${all_time_high:,.2f} ({ath_date_str})
+• 하락률: ▼ {drop_percentage:.2f}%
+
+<b>TQQQ</b>
+• 현재가: ${tqqq_price:.2f}
+
+<b>📉 나스닥 100 하락 시 (전고점 대비) TQQQ 예상가</b>
+<i>(20거래일 가정, 복리 계산)</i>
+{scenario_lines}
+"""
+
+
+# 정적 키보드는 매 요청마다 새로 만들지 않고 모듈 레벨에서 한 번만 생성
+# (InlineKeyboardMarkup은 불변 객체라 재사용해도 안전)
+KEYWORD_FOOTER_ROWS = [
+    [InlineKeyboardButton("🗑️ 모두 삭제", callback_data="removeall")],
+    [InlineKeyboardButton("📰 즉시 뉴스 확인", callback_data="check_news_now")],
+    [InlineKeyboardButton("➕ 키워드 추가", callback_data="add_keyword")],
+]
+ADD_KEYWORD_ONLY_MARKUP = InlineKeyboardMarkup(
+    [[InlineKeyboardButton("➕ 키워드 추가", callback_data="add_keyword")]]
+)
+
+
+@lru_cache(maxsize=512)
+def _keyword_list_render(keywords):
+    """키워드 목록 텍스트와 삭제 버튼 키보드 생성 (같은 키워드 조합이면 재사용)
+
+    목록 조회/추가/삭제마다 동일한 문자열과 키보드 객체를 다시 만들지 않도록
+    키워드 튜플을 키로 메모이제이션 (InlineKeyboardMarkup은 불변이라 공유해도 안전)
+    """
+    keyboard = []
+    for i in range(0, len(keywords), 2):
+        keyboard.append([
+            InlineKeyboardButton(f"🗑️ {kw}", callback_data=f"remove:{kw}")
+            for kw in keywords[i:i + 2]
+        ])
+    keyboard.extend(KEYWORD_FOOTER_ROWS)
+    keyword_list = '\n'.join([f"• {kw}" for kw in keywords])
+    return keyword_list, InlineKeyboardMarkup(keyboard)
+
+
+def _build_quiet_start_markup():
+    """방해금지 시작 시간 선택 키보드 (19:00 ~ 02:00, 1시간 간격, 2열 배치)"""
+    keyboard = []
+    hours = [19, 20, 21, 22, 23, 0, 1, 2]
+    for i in range(0, len(hours), 2):
+        row = []
+        for hour in hours[i:i + 2]:
+            time_str = f"{hour:02d}:00"
+            # 하이픈으로 구분 (콜론 문제 해결)
+            row.append(InlineKeyboardButton(f"🕐 {time_str}", callback_data=f"quiet-start-{hour:02d}00"))
+        keyboard.append(row)
+    return InlineKeyboardMarkup(keyboard)
+
+
+QUIET_START_MARKUP = _build_quiet_start_markup()
+
+
+@lru_cache(maxsize=8)
+def _quiet_end_markup(start_hour):
+    """방해금지 종료 시간 선택 키보드 (시작 시간별로 한 번만 생성)"""
+    keyboard = []
+    # 05:00 ~ 10:00까지 1시간 간격
+    hours = [5, 6, 7, 8, 9, 10]
+    for i in range(0, len(hours), 2):
+        row = []
+        for hour in hours[i:i + 2]:
+            time_str = f"{hour:02d}:00"
+            # quiet-end-시작시간-종료시간
+            row.append(InlineKeyboardButton(f"🕐 {time_str}", callback_data=f"quiet-end-{start_hour}-{hour:02d}00"))
+        keyboard.append(row)
+    return InlineKeyboardMarkup(keyboard)
+
+
+@lru_cache(maxsize=256)
+def _hm_to_minutes(hm):
+    """'HH:MM' 문자열을 자정 기준 분 단위 정수로 변환 (설정값 종류가 적어 캐시)"""
+    hours, minutes = hm.split(':')
+    return int(hours) * 60 + int(minutes)
+
+
+@lru_cache(maxsize=2048)
+def _parse_news_date(date_str):
+    """RFC822 형식 뉴스 날짜 파싱 (같은 기사가 사용자마다 반복되므로 결과 캐시)"""
+    dt = parsedate_to_datetime(date_str)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=KST)
+    return dt
+
+
+# 제목에 [단독], [속보], [긴급] 또는 (단독), (속보), (긴급) 포함 시 별표
+_SPECIAL_RE = re.compile(r'[\[\(](단독|속보|긴급)[\]\)]')
+
+
+@lru_cache(maxsize=4096)
+def _keyword_operator(keyword):
+    """키워드의 복합연산자 종류 반환 ('and', 'or', None) - 반복 소문자 변환/검색 제거"""
+    low = keyword.lower()
+    if " and " in low:
+        return "and"
+    elif " or " in low:
+        return "or"
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _normalize_keyword(keyword):
+    """복합연산 키워드를 기본 키워드 튜플로 분해 (사이클마다 같은 키워드가 반복되므로 캐시)"""
+    op = _keyword_operator(keyword)
+    if op == "and":
+        return tuple(kw.strip() for kw in keyword.split(" and "))
+    elif op == "or":
+        return tuple(kw.strip() for kw in keyword.split(" or "))
+    else:
+        return (keyword.strip(),)
+
+
+@lru_cache(maxsize=2048)
+def _news_icon(title, similar_count):
+    """뉴스 아이콘 결정 (같은 기사가 사용자마다 반복 렌더링되므로 결과 캐시)"""
+    if _SPECIAL_RE.search(title):
+        return '⭐'
+
+    # 유사 개수에 따른 아이콘
+    if similar_count >= 5:
+        return '🔥🔥'
+    elif similar_count >= 2:
+        return '🔥'
+    else:
+        return '🔹'  # 1건: 현재와 동일
+
 class TeleNewsBot:
     def __init__(self):
         self.db = Database()
@@ -29,29 +229,41 @@ class TeleNewsBot:
         self.stock_monitor = StockMonitor()
         self.scheduler = AsyncIOScheduler()
         self.application = None
-        self.waiting_for_keyword = {}  # 사용자가 키워드 입력 대기 중인지 추적
+        # 사용자가 키워드 입력 대기 중인지 추적
+        # (입력을 포기한 사용자의 항목이 쌓이지 않도록 10분 후 자동 만료)
+        self.waiting_for_keyword = TTLCache(maxsize=10_000, ttl=600)
+        # 방해금지 설정 캐시 (메시지마다 DB 조회 방지 - 설정 변경 시 무효화)
+        self._quiet_hours_cache = {}  # {user_id: (저장 시각, 설정)}
+        self._quiet_hours_cache_ttl = 300  # 초
+        # 주가 리포트 캐시 (동시에 여러 사용자가 /stock을 눌러도 yfinance 호출은 1회)
+        self._stock_report_cache = {}  # {알림 활성 여부: (저장 시각, 리포트)}
+        self._stock_report_ttl = 60  # 초
+        self._stock_report_lock = asyncio.Lock()
+        # 텔레그램 전역 전송 속도 제한 (30 msg/s 한도보다 약간 낮게)
+        self._tg_limiter = AsyncLimiter(29, 1)
+        # 네이버 API 전역 호출 속도 제한 (경로별 고정 sleep 대신 토큰 버킷 공유)
+        self._crawler_limiter = AsyncLimiter(10, 1)
+        # 대기 주가 알림 보유 사용자 집합 (quiet:off마다 SQL 조회하지 않도록 동기화 유지)
+        self._users_with_pending = set(self.db.get_pending_alert_user_ids())
+        # 메인 메뉴 버튼 라우팅 테이블 (handle_text_message의 if/elif 체인 대체)
+        self._menu_routes = {
+            "📋 키워드 목록": self.list_keywords_command,
+            "📰 즉시 뉴스 확인": self.check_news_command,
+            "📊 주가 정보": self.stock_info_command,
+            "🔕 방해금지 설정": self.set_quiet_command,
+        }
+        # 전송 완료 URL 인메모리 캐시 ((user_id, keyword)별 - 첫 조회 시 최근 기록 예열)
+        # DB 보관 기간(cleanup_old_news 7일)과 맞추고, 1시간 후 재예열해 메모리 사용을 제한
+        self._sent_urls_cache = TTLCache(maxsize=10_000, ttl=3600)
     
     
     def normalize_keyword(self, keyword):
         """복합연산 키워드를 기본 키워드로 분해 (단순화)"""
-        if " and " in keyword.lower():
-            return [kw.strip() for kw in keyword.split(" and ")]
-        elif " or " in keyword.lower():
-            return [kw.strip() for kw in keyword.split(" or ")]
-        else:
-            return [keyword.strip()]
+        return _normalize_keyword(keyword)
     
     def _remove_duplicates(self, news_list):
-        """URL 기준으로 중복 뉴스 제거"""
-        seen_urls = set()
-        unique_news = []
-        
-        for news in news_list:
-            if news['url'] not in seen_urls:
-                unique_news.append(news)
-                seen_urls.add(news['url'])
-        
-        return unique_news
+        """URL 기준으로 중복 뉴스 제거 (dict가 삽입 순서를 보존하므로 순서 유지)"""
+        return list({news['url']: news for news in news_list}.values())
     
     def get_unique_base_keywords(self, user_keywords):
         """고유한 기본 키워드만 추출 (AND 연산 키워드 제외)"""
@@ -63,7 +275,7 @@ class TeleNewsBot:
             keyword_mapping[keyword] = normalized
             
             # AND 연산 키워드인지 확인
-            if " and " in keyword.lower():
+            if _keyword_operator(keyword) == "and":
                 # AND 연산 키워드는 기본 키워드 호출에서 제외
                 continue
             else:
@@ -72,35 +284,30 @@ class TeleNewsBot:
         
         return list(base_keywords), keyword_mapping
     
-    def apply_operation(self, keyword, base_news_map):
+    async def _search_keyword(self, query, max_count=100):
+        """네이버 검색 API 호출 (전역 속도 제한 공유, 블로킹 호출은 스레드로 오프로드)"""
+        async with self._crawler_limiter:
+            return await asyncio.to_thread(
+                self.news_crawler._search_single_keyword, query, max_count
+            )
+
+    async def apply_operation(self, keyword, base_news_map):
         """복합연산에 따라 뉴스 조합 (단순화된 AND/OR 연산)"""
         base_keywords = self.normalize_keyword(keyword)
-        
-        if " and " in keyword.lower():
+        op = _keyword_operator(keyword)
+
+        if op == "and":
             # AND 연산: 네이버 + 연산자 활용
             if not base_keywords:
                 logger.warning(f"키워드 '{keyword}': 기본 키워드 없음")
                 return []
-            
+
             if len(base_keywords) == 2:
                 # 2개 키워드: A +B, B +A 검색
-                query1 = f"{base_keywords[0]} +{base_keywords[1]}"
-                query2 = f"{base_keywords[1]} +{base_keywords[0]}"
-                
-                news1 = self.news_crawler._search_single_keyword(query1, max_count=100)
-                news2 = self.news_crawler._search_single_keyword(query2, max_count=100)
-                
-                # 결과 합치기
-                all_news = news1 + news2
-                
-                # 중복 제거
-                unique_news = self._remove_duplicates(all_news)
-                
-                # 유사뉴스 필터링
-                filtered_news = self.news_crawler.filter_similar_news(unique_news, similarity_threshold=0.55)
-                
-                return filtered_news[:15]  # 15개 제한
-                
+                queries = [
+                    f"{base_keywords[0]} +{base_keywords[1]}",
+                    f"{base_keywords[1]} +{base_keywords[0]}",
+                ]
             elif len(base_keywords) >= 3:
                 # 3개 이상: 대표 조합 3가지 검색 (방안 3)
                 queries = [
@@ -108,128 +315,175 @@ class TeleNewsBot:
                     f"{base_keywords[1]} +{base_keywords[0]} +{base_keywords[2]}",
                     f"{base_keywords[2]} +{base_keywords[0]} +{base_keywords[1]}"
                 ]
-                
-                all_news = []
-                for i, query in enumerate(queries, 1):
-                    news = self.news_crawler._search_single_keyword(query, max_count=100)
-                    all_news.extend(news)
-                
-                # 중복 제거
-                unique_news = self._remove_duplicates(all_news)
-                
-                # 유사뉴스 필터링
-                filtered_news = self.news_crawler.filter_similar_news(unique_news, similarity_threshold=0.55)
-                
-                return filtered_news[:15]  # 15개 제한
-            
-        elif " or " in keyword.lower():
+            else:
+                return []
+
+            # 독립적인 검색이므로 순차 대기 대신 동시 실행
+            results = await asyncio.gather(*(self._search_keyword(q) for q in queries))
+            all_news = [news for result in results for news in result]
+
+            # 중복 제거
+            unique_news = self._remove_duplicates(all_news)
+
+            # 유사뉴스 필터링 (CPU 작업 - 이벤트 루프 블로킹 방지)
+            filtered_news = await asyncio.to_thread(
+                self.news_crawler.filter_similar_news, unique_news, 0.55
+            )
+
+            return filtered_news[:15]  # 15개 제한
+
+        elif op == "or":
             # OR 연산: 통합 후 필터링 (방안 2)
             all_news = []
-            
+
             # 1. 모든 키워드의 뉴스 통합 (유사뉴스 필터링 전)
             for base_kw in base_keywords:
                 base_news = base_news_map.get(base_kw, [])
                 all_news.extend(base_news)
-            
+
             # 2. URL 기준 중복 제거
             unique_news = self._remove_duplicates(all_news)
-            
+
             # 3. 유사뉴스 필터링 (키워드 간 중복/유사뉴스 제거)
-            filtered_news = self.news_crawler.filter_similar_news(unique_news, similarity_threshold=0.55)
-            
+            filtered_news = await asyncio.to_thread(
+                self.news_crawler.filter_similar_news, unique_news, 0.55
+            )
+
             # 4. 최신순 정렬 후 15개 제한
             sorted_news = self._sort_news_by_date(filtered_news)
-            
+
             return sorted_news[:15]
         else:
             # 단일 키워드
             result = base_news_map.get(base_keywords[0], [])
             return result[:15]  # 15개 제한
     
+    def _render_keyword_list(self, keywords):
+        """키워드 목록 텍스트 + 삭제 버튼 키보드 생성 (키워드 조합별 캐시)"""
+        return _keyword_list_render(tuple(keywords))
+
     def unblock_user_if_needed(self, user_id):
         """사용자가 봇을 다시 사용하려고 할 때 차단 목록에서 제거"""
         if self.db.is_user_blocked(user_id):
             self.db.remove_blocked_user(user_id)
             logger.info(f"사용자 {user_id} - 차단 목록에서 제거됨 (봇 재사용)")
     
+    def _get_quiet_hours_cached(self, user_id):
+        """방해금지 설정 조회 (TTL 캐시 - 발송 건마다 DB를 조회하지 않도록)"""
+        cached = self._quiet_hours_cache.get(user_id)
+        if cached and time.time() - cached[0] < self._quiet_hours_cache_ttl:
+            return cached[1]
+        quiet_hours = self.db.get_quiet_hours(user_id)
+        self._quiet_hours_cache[user_id] = (time.time(), quiet_hours)
+        return quiet_hours
+
+    def _invalidate_quiet_hours_cache(self, user_id):
+        """방해금지 설정 변경 시 캐시 무효화"""
+        self._quiet_hours_cache.pop(user_id, None)
+
+    def _prewarm_quiet_hours_cache(self, user_ids):
+        """여러 사용자의 방해금지 설정을 한 번의 쿼리로 캐시에 적재"""
+        now = time.time()
+        missing = [uid for uid in user_ids
+                   if uid not in self._quiet_hours_cache
+                   or now - self._quiet_hours_cache[uid][0] >= self._quiet_hours_cache_ttl]
+        if not missing:
+            return
+        for uid, quiet_hours in self.db.get_quiet_hours_bulk(missing).items():
+            self._quiet_hours_cache[uid] = (now, quiet_hours)
+
     def is_quiet_time(self, user_id):
         """현재 시간이 사용자의 방해금지 시간인지 확인"""
-        quiet_hours = self.db.get_quiet_hours(user_id)
+        quiet_hours = self._get_quiet_hours_cached(user_id)
         if not quiet_hours or not quiet_hours['enabled']:
             logger.debug(f"[방해금지] 사용자 {user_id} - 방해금지 설정 없음 또는 비활성화")
             return False
-        
-        from datetime import datetime, timezone, timedelta
-        # 한국 시간 (GMT+9)
-        kst = timezone(timedelta(hours=9))
-        now = datetime.now(kst)
-        current_time = now.strftime('%H:%M')
-        
-        start = quiet_hours['start_time']
-        end = quiet_hours['end_time']
-        
+
+        # 한국 시간 (GMT+9) 기준, 문자열 비교 대신 분 단위 정수 비교
+        now = datetime.now(KST)
+        current_minutes = now.hour * 60 + now.minute
+
+        start = _hm_to_minutes(quiet_hours['start_time'])
+        end = _hm_to_minutes(quiet_hours['end_time'])
+
         # 시간 비교 (자정을 넘는 경우도 고려)
         if start <= end:
             # 예: 09:00 ~ 18:00 (자정을 넘지 않음)
-            is_quiet = start <= current_time <= end
+            is_quiet = start <= current_minutes <= end
         else:
             # 예: 22:00 ~ 07:00 (자정을 넘는 경우)
-            is_quiet = current_time >= start or current_time <= end
-        
+            is_quiet = current_minutes >= start or current_minutes <= end
+
         # 디버깅 로그 (항상 출력)
-        logger.debug(f"[방해금지] 사용자 {user_id} - 현재시간: {current_time}, 설정: {start}~{end}, 활성: {quiet_hours['enabled']}, 결과: {is_quiet}")
-        
+        logger.debug(f"[방해금지] 사용자 {user_id} - 현재시간: {now.hour:02d}:{now.minute:02d}, 설정: {quiet_hours['start_time']}~{quiet_hours['end_time']}, 활성: {quiet_hours['enabled']}, 결과: {is_quiet}")
+
         return is_quiet
     
-    async def safe_reply(self, message, text, parse_mode='HTML', reply_markup=None):
-        """안전한 메시지 응답 (강화된 재시도 포함)"""
-        max_retries = 3  # 재시도 횟수
-        base_delay = 2  # 기본 대기 시간
-        
+    async def _send_with_retry(self, send_fn, *, max_retries=3, base_delay=2,
+                               on_forbidden=None):
+        """텔레그램 API 호출 재시도 래퍼 (예외 클래스 기반 분류)
+
+        :param send_fn: 실제 전송을 수행하는 코루틴 팩토리 (인자 없음)
+        :param on_forbidden: 사용자가 봇을 차단했을 때 호출할 콜백
+        :return: 전송 성공 여부
+        """
         for attempt in range(max_retries):
             try:
-                await message.reply_text(text, parse_mode=parse_mode, reply_markup=reply_markup)
+                # 토큰 버킷으로 전역 전송 속도 제한 (고정 딜레이 대신 API 허용치까지 사용)
+                async with self._tg_limiter:
+                    await send_fn()
                 if attempt > 0:
-                    logger.info(f"✅ 메시지 응답 성공 ({attempt + 1}번째 시도)")
-                
-                # 성공 시 짧은 딜레이
-                await asyncio.sleep(0.5)
-                return
-                
-            except Exception as e:
-                error_str = str(e)
-                error_type = type(e).__name__
-                
+                    logger.info(f"✅ 메시지 전송 성공 ({attempt + 1}번째 시도)")
+                return True
+
+            except Forbidden:
                 # 사용자가 봇을 차단한 경우 - 재시도 불필요
-                if 'bot was blocked' in error_str or 'Forbidden' in error_type:
-                    logger.warning(f"⚠️ 메시지 응답 실패 - 봇 차단됨")
-                    break
-                
-                # 재시도 가능한 오류인지 확인
-                is_retryable_error = any(err in error_str or err in error_type for err in [
-                    'ConnectError', 'NetworkError', 'TimedOut', 'TimeoutError',
-                    'ConnectionError', 'ReadTimeout', 'ConnectTimeout',
-                    'RemoteDisconnected', 'BadGateway', 'ServiceUnavailable'
-                ])
-                
+                logger.warning(f"⚠️ 메시지 전송 실패 - 봇 차단됨")
+                if on_forbidden:
+                    on_forbidden()
+                return False
+
+            except RetryAfter as e:
+                # 텔레그램이 알려준 대기 시간만큼 정확히 대기 (FloodWait)
                 if attempt < max_retries - 1:
-                    if is_retryable_error:
-                        # 지수 백오프: 3초, 6초, 12초, 24초, 48초
-                        wait_time = base_delay * (2 ** attempt)
-                        logger.warning(f"🔄 응답 실패, {wait_time}초 후 재시도 ({attempt + 1}/{max_retries})")
-                        logger.debug(f"   오류 상세: {error_type}: {error_str[:150]}")
-                        await asyncio.sleep(wait_time)
-                        continue
-                    else:
-                        # 재시도 불가능한 오류
-                        logger.error(f"❌ 재시도 불가능한 응답 오류: {error_type}: {error_str[:150]}")
-                        break
-                else:
-                    # 최종 실패
-                    logger.error(f"❌ 메시지 응답 최종 실패 ({max_retries}회 시도)")
-                    logger.error(f"   최종 오류: {error_type}: {error_str[:150]}")
-                    break
-        
+                    wait_time = e.retry_after + 0.1
+                    logger.warning(f"🔄 FloodWait, {wait_time:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+                    await asyncio.sleep(wait_time)
+                    continue
+                logger.error(f"❌ 메시지 전송 최종 실패 ({max_retries}회 시도): FloodWait")
+                return False
+
+            except BadRequest as e:
+                # NetworkError의 하위 클래스지만 재시도해도 소용 없는 오류
+                logger.error(f"❌ 재시도 불가능한 오류: BadRequest: {str(e)[:150]}")
+                return False
+
+            except (TimedOut, NetworkError) as e:
+                if attempt < max_retries - 1:
+                    # 지수 백오프 (상한 30초) + 10% 지터
+                    wait_time = min(30, base_delay * (2 ** attempt))
+                    wait_time *= 1 + random.random() * 0.1
+                    logger.warning(f"🔄 네트워크 오류, {wait_time:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+                    logger.debug(f"   오류 상세: {type(e).__name__}: {str(e)[:150]}")
+                    await asyncio.sleep(wait_time)
+                    continue
+                logger.error(f"❌ 메시지 전송 최종 실패 ({max_retries}회 시도)")
+                logger.error(f"   최종 오류: {type(e).__name__}: {str(e)[:150]}")
+                return False
+
+            except Exception as e:
+                # 그 외 오류는 재시도 불가능으로 처리
+                logger.error(f"❌ 재시도 불가능한 오류: {type(e).__name__}: {str(e)[:150]}")
+                return False
+
+        return False
+
+    async def safe_reply(self, message, text, parse_mode=ParseMode.HTML, reply_markup=None):
+        """안전한 메시지 응답 (강화된 재시도 포함)"""
+        await self._send_with_retry(
+            lambda: message.reply_text(text, parse_mode=parse_mode, reply_markup=reply_markup)
+        )
+
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """봇 시작 명령어"""
         user_id = update.effective_chat.id
@@ -239,31 +493,13 @@ class TeleNewsBot:
         
         # 인증 여부 확인
         if BOT_PASSWORD and not self.db.is_user_authorized(user_id):
-            await self.safe_reply(update.message, "🔒 <b>비밀번호를 입력해주세요.</b>\n\n봇 사용을 위해 관리자가 설정한 비밀번호가 필요합니다.\n\n문의: gmlehddl95@gmail.com", parse_mode='HTML')
+            await self.safe_reply(update.message, "🔒 <b>비밀번호를 입력해주세요.</b>\n\n봇 사용을 위해 관리자가 설정한 비밀번호가 필요합니다.\n\n문의: gmlehddl95@gmail.com", parse_mode=ParseMode.HTML)
             return
             
         # 차단 목록에서 제거 (사용자가 다시 봇을 사용하려고 함)
         self.unblock_user_if_needed(user_id)
         
-        welcome_message = f"""🤖 <b>TeleNews 봇에 오신 것을 환영합니다!</b>
-
-📌 <b>자동 알림</b>
-• 뉴스: {NEWS_CHECK_INTERVAL}분마다 키워드 뉴스 자동 확인 후 메세지로 전송
-  * 이미 전송한 뉴스는 보내지 않음
-• 주가: 나스닥 100 전고점 대비 5%부터 1%p 단위로 하락시 알림
-
-💡 <b>사용 방법</b>
-하단 버튼을 클릭하여 시작
-"""
-        
-        # 메인 메뉴 키보드 버튼
-        keyboard = [
-            [KeyboardButton("📋 키워드 목록"), KeyboardButton("📰 즉시 뉴스 확인")],
-            [KeyboardButton("📊 주가 정보"), KeyboardButton("🔕 방해금지 설정")]
-        ]
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
-        
-        await self.safe_reply(update.message, welcome_message, parse_mode='HTML', reply_markup=reply_markup)
+        await self.safe_reply(update.message, WELCOME_MESSAGE, parse_mode=ParseMode.HTML, reply_markup=MAIN_MENU_MARKUP)
     
     async def add_keyword_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """키워드 추가 (콤마로 구분하여 여러 개 동시 입력 가능)"""
@@ -288,19 +524,10 @@ class TeleNewsBot:
             else:
                 keywords = [input_text.strip()]
             
-            # 로딩 메시지 표시
-            loading_msg = await self.safe_reply(update.message, f"➕ 키워드를 추가하는 중...")
-            await asyncio.sleep(0.4)  # 애니메이션 효과
-            
-            added = []
-            already_exist = []
-            
-            for keyword in keywords:
-                if self.db.add_keyword(user_id, keyword):
-                    added.append(keyword)
-                    logger.info(f"사용자 {user_id} - 키워드 추가됨: {keyword}")
-                else:
-                    already_exist.append(keyword)
+            # 키워드 일괄 추가 (트랜잭션/커밋 1회)
+            added, already_exist = self.db.add_keywords(user_id, keywords)
+            if added:
+                logger.info(f"사용자 {user_id} - 키워드 추가됨: {', '.join(added)}")
             
             # 결과 메시지 생성
             message = ""
@@ -320,13 +547,6 @@ class TeleNewsBot:
                     message += f"⚠️ {len(already_exist)}개 이미 등록됨:\n"
                     message += ", ".join(already_exist)
             
-            # 로딩 메시지 삭제
-            if loading_msg:
-                try:
-                    await loading_msg.delete()
-                except:
-                    pass
-            
             # 결과 메시지 표시
             if message:
                 await self.safe_reply(update.message, message)
@@ -334,48 +554,20 @@ class TeleNewsBot:
             # 키워드 목록 자동 표시
             all_keywords = self.db.get_keywords(user_id)
             if all_keywords:
-                keyword_list = '\n'.join([f"• {kw}" for kw in all_keywords])
-                
-                # 각 키워드마다 삭제 버튼 생성 (2열로 배치)
-                keyboard = []
-                for i in range(0, len(all_keywords), 2):
-                    row = []
-                    # 첫 번째 키워드
-                    keyword1 = all_keywords[i]
-                    row.append(InlineKeyboardButton(f"🗑️ {keyword1}", callback_data=f"remove:{keyword1}"))
-                    
-                    # 두 번째 키워드 (있으면)
-                    if i + 1 < len(all_keywords):
-                        keyword2 = all_keywords[i + 1]
-                        row.append(InlineKeyboardButton(f"🗑️ {keyword2}", callback_data=f"remove:{keyword2}"))
-                    
-                    keyboard.append(row)
-                
-                # 모두 삭제, 즉시 뉴스 확인 및 키워드 추가 버튼
-                keyboard.append([InlineKeyboardButton("🗑️ 모두 삭제", callback_data="removeall")])
-                keyboard.append([InlineKeyboardButton("📰 즉시 뉴스 확인", callback_data="check_news_now")])
-                keyboard.append([InlineKeyboardButton("➕ 키워드 추가", callback_data="add_keyword")])
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
+                # 목록 텍스트 + 삭제 버튼 키보드 (키워드 조합별 캐시, 2열 배치 + 공통 하단 버튼)
+                keyword_list, reply_markup = self._render_keyword_list(all_keywords)
+
                 await self.safe_reply(
                     update.message,
                     f"📝 <b>등록된 키워드 목록:</b>\n\n{keyword_list}\n\n버튼을 눌러 삭제할 수 있습니다.", 
-                    parse_mode='HTML',
+                    parse_mode=ParseMode.HTML,
                     reply_markup=reply_markup
                 )
         else:
             # 인자가 없으면 대화형 모드 시작
             input_msg = await update.message.reply_text(
-                "📝 <b>추가할 키워드를 입력해주세요</b>\n\n"
-                "🔹 <b>단순 키워드</b>\n"
-                "예시: 단독, 속보, 삼성전자, AI, 나스닥\n"
-                "💡 콤마(,)로 구분하여 여러 개 동시 입력 가능\n\n"
-                "🔹 <b>논리 연산 (AND/OR)</b>\n"
-                "• <code>삼성 and 애플</code> - 삼성과 애플 모두 관련된 기사\n"
-                "• <code>삼성 or 애플</code> - 삼성 또는 애플 관련 기사\n"
-                "and 와 or은 혼합하여 사용 불가\n", 
-                parse_mode='HTML')
+                ADD_KEYWORD_HELP,
+                parse_mode=ParseMode.HTML)
             
             # 대기 상태 저장 (입력 안내 메시지 ID 저장)
             self.waiting_for_keyword[user_id] = {
@@ -419,34 +611,12 @@ class TeleNewsBot:
         if not keywords:
             await update.message.reply_text("📝 등록된 키워드가 없습니다.\n/add 명령으로 키워드를 추가하세요.")
         else:
-            # 키워드 목록 텍스트
-            keyword_list = '\n'.join([f"• {kw}" for kw in keywords])
-            
-            # 각 키워드마다 삭제 버튼 생성 (2열로 배치)
-            keyboard = []
-            for i in range(0, len(keywords), 2):
-                row = []
-                # 첫 번째 키워드
-                keyword1 = keywords[i]
-                row.append(InlineKeyboardButton(f"🗑️ {keyword1}", callback_data=f"remove:{keyword1}"))
-                
-                # 두 번째 키워드 (있으면)
-                if i + 1 < len(keywords):
-                    keyword2 = keywords[i + 1]
-                    row.append(InlineKeyboardButton(f"🗑️ {keyword2}", callback_data=f"remove:{keyword2}"))
-                
-                keyboard.append(row)
-            
-            # 모두 삭제, 즉시 뉴스 확인 및 키워드 추가 버튼
-            keyboard.append([InlineKeyboardButton("🗑️ 모두 삭제", callback_data="removeall")])
-            keyboard.append([InlineKeyboardButton("📰 즉시 뉴스 확인", callback_data="check_news_now")])
-            keyboard.append([InlineKeyboardButton("➕ 키워드 추가", callback_data="add_keyword")])
-            
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
+            # 목록 텍스트 + 삭제 버튼 키보드 (키워드 조합별 캐시, 2열 배치 + 공통 하단 버튼)
+            keyword_list, reply_markup = self._render_keyword_list(keywords)
+
             await update.message.reply_text(
                 f"📝 <b>등록된 키워드 목록:</b>\n\n{keyword_list}\n\n키워드별 최대 15개 뉴스 전송\n버튼을 눌러 삭제할 수 있습니다.", 
-                parse_mode='HTML',
+                parse_mode=ParseMode.HTML,
                 reply_markup=reply_markup
             )
     
@@ -474,10 +644,8 @@ class TeleNewsBot:
             
         quiet_hours = self.db.get_quiet_hours(user_id)
         
-        from datetime import datetime, timezone, timedelta
         # 한국 시간 (GMT+9)
-        kst = timezone(timedelta(hours=9))
-        now = datetime.now(kst)
+        now = datetime.now(KST)
         current_time = now.strftime('%H:%M')
         
         # 현재 설정 정보 및 상태
@@ -514,7 +682,7 @@ class TeleNewsBot:
             f"🔕 <b>방해금지 설정</b>{current_info}\n\n"
             "방해금지 시작 시간과 종료 시간을 각각 선택할 수 있습니다.\n\n"
             "💡 설정한 시간대에는 자동 알림이 전송되지 않습니다.",
-            parse_mode='HTML',
+            parse_mode=ParseMode.HTML,
             reply_markup=reply_markup
         )
     
@@ -536,7 +704,6 @@ class TeleNewsBot:
             total_keywords = len(all_keywords)
             
             # 사용자별 키워드 수 계산
-            from collections import defaultdict
             user_keyword_count = defaultdict(int)
             for user_id, keyword in all_keywords:
                 user_keyword_count[user_id] += 1
@@ -553,7 +720,7 @@ class TeleNewsBot:
 🕐 <b>조회 시간</b>
 • {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
             
-            await update.message.reply_text(users_message, parse_mode='HTML')
+            await update.message.reply_text(users_message, parse_mode=ParseMode.HTML)
             
         except Exception as e:
             logger.error(f"사용자 수 조회 중 오류: {e}")
@@ -572,24 +739,18 @@ class TeleNewsBot:
             return
         
         if data == "removeall":
-            # 모두 삭제 - 애니메이션 효과
-            # 1단계: 삭제 중 표시
-            await query.edit_message_text("🗑️ 모든 키워드를 삭제하는 중...")
-            await asyncio.sleep(0.4)  # 애니메이션 효과
-            
-            # 2단계: 실제 삭제
+            # 모두 삭제 (버튼 응답은 query.answer()가 즉시 처리하므로 중간 편집/딜레이 불필요)
             deleted_count = self.db.remove_all_keywords(user_id)
-            
+
             # 3단계: 키워드 목록 화면 표시 (키워드 추가 버튼만)
-            keyboard = [[InlineKeyboardButton("➕ 키워드 추가", callback_data="add_keyword")]]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
+            reply_markup = ADD_KEYWORD_ONLY_MARKUP
+
             if deleted_count > 0:
                 await query.edit_message_text(
                     f"✅ 모든 키워드가 제거되었습니다. (총 {deleted_count}개)\n\n"
                     "📝 <b>등록된 키워드가 없습니다.</b>\n\n"
                     "➕ 키워드 추가 버튼을 눌러 키워드를 등록해주세요!",
-                    parse_mode='HTML',
+                    parse_mode=ParseMode.HTML,
                     reply_markup=reply_markup
                 )
                 logger.info(f"사용자 {user_id} - 모든 키워드 제거됨 ({deleted_count}개)")
@@ -597,53 +758,35 @@ class TeleNewsBot:
                 await query.edit_message_text(
                     "📝 <b>등록된 키워드가 없습니다.</b>\n\n"
                     "➕ 키워드 추가 버튼을 눌러 키워드를 등록해주세요!",
-                    parse_mode='HTML',
+                    parse_mode=ParseMode.HTML,
                     reply_markup=reply_markup
                 )
         
         elif data.startswith("remove:"):
-            # 개별 키워드 삭제 - 애니메이션 효과
-            keyword = data.split(":", 1)[1]
-            
-            # 1단계: 삭제 중 표시
-            await query.edit_message_text(f"🗑️ '{keyword}' 삭제 중...")
-            await asyncio.sleep(0.4)  # 애니메이션 효과
-            
-            # 2단계: 실제 삭제
+            # 개별 키워드 삭제 (중간 "삭제 중" 편집 없이 바로 최종 상태로 편집)
+            keyword = data[len("remove:"):]
+
             if self.db.remove_keyword(user_id, keyword):
                 # 키워드 제거 후 남은 키워드 목록 다시 표시
                 keywords = self.db.get_keywords(user_id)
                 
                 if keywords:
-                    keyword_list = '\n'.join([f"• {kw}" for kw in keywords])
-                    keyboard = []
-                    # 키워드 버튼 2열로 배치
-                    for i in range(0, len(keywords), 2):
-                        row = []
-                        row.append(InlineKeyboardButton(f"🗑️ {keywords[i]}", callback_data=f"remove:{keywords[i]}"))
-                        if i + 1 < len(keywords):
-                            row.append(InlineKeyboardButton(f"🗑️ {keywords[i + 1]}", callback_data=f"remove:{keywords[i + 1]}"))
-                        keyboard.append(row)
-                    keyboard.append([InlineKeyboardButton("🗑️ 모두 삭제", callback_data="removeall")])
-                    keyboard.append([InlineKeyboardButton("📰 즉시 뉴스 확인", callback_data="check_news_now")])
-                    keyboard.append([InlineKeyboardButton("➕ 키워드 추가", callback_data="add_keyword")])
-                    reply_markup = InlineKeyboardMarkup(keyboard)
-                    
+                    keyword_list, reply_markup = self._render_keyword_list(keywords)
+
                     await query.edit_message_text(
                         f"✅ '{keyword}' 제거됨!\n\n📝 <b>남은 키워드:</b>\n\n{keyword_list}\n\n버튼을 눌러 삭제할 수 있습니다.",
-                        parse_mode='HTML',
+                        parse_mode=ParseMode.HTML,
                         reply_markup=reply_markup
                     )
                 else:
                     # 마지막 키워드도 삭제됨 - 키워드 추가 버튼 표시
-                    keyboard = [[InlineKeyboardButton("➕ 키워드 추가", callback_data="add_keyword")]]
-                    reply_markup = InlineKeyboardMarkup(keyboard)
-                    
+                    reply_markup = ADD_KEYWORD_ONLY_MARKUP
+
                     await query.edit_message_text(
                         f"✅ '{keyword}' 제거됨!\n\n"
                         "📝 <b>등록된 키워드가 없습니다.</b>\n\n"
                         "➕ 키워드 추가 버튼을 눌러 키워드를 등록해주세요!",
-                        parse_mode='HTML',
+                        parse_mode=ParseMode.HTML,
                         reply_markup=reply_markup
                     )
                 
@@ -656,43 +799,40 @@ class TeleNewsBot:
             if data == "quiet:off":
                 # 방해금지 해제
                 if self.db.disable_quiet_hours(user_id):
-                    # 현재 상태 확인
-                    from datetime import datetime, timezone, timedelta
-                    kst = timezone(timedelta(hours=9))
-                    now = datetime.now(kst)
-                    current_time = now.strftime('%H:%M')
-                    
+                    self._invalidate_quiet_hours_cache(user_id)
+
                     await query.edit_message_text(
                         f"🔔 방해금지 시간이 해제되었습니다!\n\n"
                         f"📌 <b>현재 상태</b>\n"
                         f"💡 모든 자동 알림을 받습니다.",
-                        parse_mode='HTML'
+                        parse_mode=ParseMode.HTML
                     )
                     logger.info(f"사용자 {user_id} - 방해금지 시간 해제")
                     
-                    # 대기 중인 주가 알림 확인 및 전송
-                    pending = self.db.get_pending_stock_alert(user_id)
+                    # 대기 중인 주가 알림 확인 및 전송 (집합으로 선검사해 불필요한 SQL 방지)
+                    pending = (self.db.get_pending_stock_alert(user_id)
+                               if user_id in self._users_with_pending else None)
                     if pending:
                         logger.info(f"사용자 {user_id} - 대기 중인 주가 알림 전송: {pending['alert_level']}% 하락")
-                        # 나스닥 정보 재구성
+                        # 나스닥 정보 재구성 (ISO 날짜는 strptime보다 빠른 fromisoformat으로 파싱)
                         nasdaq_info_dict = pending['nasdaq_info']
-                        nasdaq_info_dict['ath_date'] = datetime.strptime(nasdaq_info_dict['ath_date'], '%Y-%m-%d')
+                        nasdaq_info_dict['ath_date'] = datetime.fromisoformat(nasdaq_info_dict['ath_date'])
                         
                         # 알림 전송
                         success = await self._send_drop_alert(user_id, pending['alert_level'], nasdaq_info_dict)
                         if success:
                             self.db.update_stock_alert_level(user_id, pending['alert_level'], pending['ath_price'], pending['ath_date'])
                             self.db.clear_pending_stock_alert(user_id)
+                            self._users_with_pending.discard(user_id)
                 else:
                     await query.edit_message_text("⚠️ 설정된 방해금지 시간이 없습니다.")
             
             elif data == "quiet:on":
                 # 방해금지 재활성화 (이전 설정으로)
                 if self.db.enable_quiet_hours(user_id):
+                    self._invalidate_quiet_hours_cache(user_id)
                     # 현재 상태 확인
-                    from datetime import datetime, timezone, timedelta
-                    kst = timezone(timedelta(hours=9))
-                    now = datetime.now(kst)
+                    now = datetime.now(KST)
                     current_time = now.strftime('%H:%M')
                     
                     # 방해금지 시간 정보 가져오기
@@ -703,78 +843,48 @@ class TeleNewsBot:
                     await query.edit_message_text(
                         f"🔕 방해금지 시간이 설정되었습니다!\n\n"
                         f"💡 설정된 시간대에는 자동 알림이 전송되지 않습니다.",
-                        parse_mode='HTML'
+                        parse_mode=ParseMode.HTML
                     )
                     logger.info(f"사용자 {user_id} - 방해금지 시간 재활성화: {start_time} ~ {end_time}")
                 else:
                     await query.edit_message_text("⚠️ 재활성화할 방해금지 설정이 없습니다.")
             
             elif data == "quiet:select_start":
-                # 시작 시간 선택 화면 (19:00 ~ 02:00, 1시간 간격)
-                keyboard = []
-                hours = [19, 20, 21, 22, 23, 0, 1, 2]
-                # 2열로 배치
-                for i in range(0, len(hours), 2):
-                    row = []
-                    for j in range(2):
-                        if i + j < len(hours):
-                            hour = hours[i + j]
-                            time_str = f"{hour:02d}:00"
-                            # 하이픈으로 구분 (콜론 문제 해결)
-                            row.append(InlineKeyboardButton(f"🕐 {time_str}", callback_data=f"quiet-start-{hour:02d}00"))
-                    keyboard.append(row)
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
+                # 시작 시간 선택 화면 (정적 키보드 재사용)
                 await query.edit_message_text(
                     "🔕 <b>방해금지 시작 시간 선택</b>\n\n"
                     "알림을 받지 않을 시작 시간을 선택하세요.",
-                    parse_mode='HTML',
-                    reply_markup=reply_markup
+                    parse_mode=ParseMode.HTML,
+                    reply_markup=QUIET_START_MARKUP
                 )
-            
+
             elif data.startswith("quiet-start-"):
                 # 시작 시간이 선택됨 -> 종료 시간 선택
-                start_hour = data.split("-")[2]  # "2200"
+                start_hour = data[len("quiet-start-"):]  # "2200"
                 start_time = f"{start_hour[:2]}:{start_hour[2:]}"  # "22:00"
-                
-                keyboard = []
-                # 05:00 ~ 10:00까지 1시간 간격
-                hours = [5, 6, 7, 8, 9, 10]
-                # 2열로 배치
-                for i in range(0, len(hours), 2):
-                    row = []
-                    for j in range(2):
-                        if i + j < len(hours):
-                            hour = hours[i + j]
-                            time_str = f"{hour:02d}:00"
-                            # quiet-end-시작시간-종료시간
-                            row.append(InlineKeyboardButton(f"🕐 {time_str}", callback_data=f"quiet-end-{start_hour}-{hour:02d}00"))
-                    keyboard.append(row)
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
+
+                reply_markup = _quiet_end_markup(start_hour)
                 await query.edit_message_text(
                     f"🔕 <b>방해금지 종료 시간 선택</b>\n\n"
                     f"시작 시간: {start_time}\n\n"
                     f"알림을 다시 받을 종료 시간을 선택하세요.",
-                    parse_mode='HTML',
+                    parse_mode=ParseMode.HTML,
                     reply_markup=reply_markup
                 )
             
             elif data.startswith("quiet-end-"):
                 # 종료 시간까지 선택됨 -> 설정 완료
-                parts = data.split("-")  # ["quiet", "end", "2200", "0700"]
-                start_hour = parts[2]  # "2200"
-                end_hour = parts[3]    # "0700"
+                # "quiet-end-2200-0700" -> 리스트 할당 없이 시작/종료 시간만 분리
+                start_hour, _, end_hour = data[len("quiet-end-"):].partition("-")  # "2200", "0700"
                 
                 start_time = f"{start_hour[:2]}:{start_hour[2:]}"  # "22:00"
                 end_time = f"{end_hour[:2]}:{end_hour[2:]}"        # "07:00"
                 
                 self.db.set_quiet_hours(user_id, start_time, end_time)
-                
+                self._invalidate_quiet_hours_cache(user_id)
+
                 # 현재 상태 확인
-                from datetime import datetime, timezone, timedelta
-                kst = timezone(timedelta(hours=9))
-                now = datetime.now(kst)
+                now = datetime.now(KST)
                 current_time = now.strftime('%H:%M')
                 is_currently_quiet = self.is_quiet_time(user_id)
                 current_status = "⚠️ 방해금지중" if is_currently_quiet else "✅ 알림중"
@@ -786,7 +896,7 @@ class TeleNewsBot:
                     f"• 방해금지 시간: {start_time} ~ {end_time}\n\n"
                     f"💡 이 시간대에는 자동 알림이 전송되지 않습니다.\n"
                     f"(수동 명령어는 사용 가능합니다)",
-                    parse_mode='HTML'
+                    parse_mode=ParseMode.HTML
                 )
                 logger.info(f"사용자 {user_id} - 방해금지 시간 설정: {start_time} ~ {end_time}")
         
@@ -816,16 +926,8 @@ class TeleNewsBot:
             
             # 입력 안내 메시지 전송
             input_msg = await query.message.reply_text(
-                "📝 <b>키워드 추가</b>\n\n"
-                "추가할 키워드를 입력해주세요.\n\n"
-                "🔹 <b>단순 키워드</b>\n"
-                "예시: 삼성전자, AI, 나스닥\n"
-                "💡 콤마(,)로 구분하여 여러 개 동시 입력 가능\n\n"
-                "🔹 <b>논리 연산 (AND/OR)</b>\n"
-                "• <code>삼성 and 애플</code> - 삼성과 애플 모두 관련된 뉴스\n"
-                "• <code>삼성 or 애플</code> - 삼성 또는 애플과 관련된 뉴스\n"
-                "and 와 or은 혼합하여 사용 불가\n",
-                parse_mode='HTML',
+                ADD_KEYWORD_HELP_FROM_LIST,
+                parse_mode=ParseMode.HTML,
                 reply_markup=reply_markup
             )
             
@@ -865,15 +967,9 @@ class TeleNewsBot:
                 await query.answer("🔕 나스닥 알림이 꺼졌습니다!")
                 logger.info(f"사용자 {user_id} - 나스닥 알림 꺼짐")
             
-            # 업데이트된 나스닥 알림 설정으로 리포트 재생성
+            # 업데이트된 나스닥 알림 설정으로 리포트 재생성 (캐시 활용)
             nasdaq_alert_enabled = self.db.get_nasdaq_alert_setting(user_id)
-            
-            # 새로운 리포트 생성 (동기 함수를 별도 스레드에서 실행)
-            updated_report = await asyncio.to_thread(
-                self.stock_monitor.get_full_report_html, 
-                user_id, 
-                nasdaq_alert_enabled
-            )
+            updated_report = await self._get_stock_report_cached(user_id, nasdaq_alert_enabled)
             
             # 버튼 상태 업데이트
             if nasdaq_alert_enabled:
@@ -889,7 +985,7 @@ class TeleNewsBot:
             # 전체 메시지 업데이트 (리포트 내용 + 버튼)
             await query.edit_message_text(
                 text=updated_report, 
-                parse_mode='HTML', 
+                parse_mode=ParseMode.HTML, 
                 reply_markup=reply_markup
             )
     
@@ -903,28 +999,17 @@ class TeleNewsBot:
             # 비밀번호 확인
             if text.strip() == BOT_PASSWORD:
                 self.db.authorize_user(user_id)
-                await self.safe_reply(update.message, "✅ <b>인증되었습니다! 환영합니다.</b>", parse_mode='HTML')
+                await self.safe_reply(update.message, "✅ <b>인증되었습니다! 환영합니다.</b>", parse_mode=ParseMode.HTML)
                 await self.start_command(update, context)
             else:
-                await self.safe_reply(update.message, "🚫 <b>비밀번호가 틀렸습니다.</b>\n\n다시 입력해주세요.\n문의: gmlehddl95@gmail.com", parse_mode='HTML')
+                await self.safe_reply(update.message, "🚫 <b>비밀번호가 틀렸습니다.</b>\n\n다시 입력해주세요.\n문의: gmlehddl95@gmail.com", parse_mode=ParseMode.HTML)
             return
         
-        # 메인 메뉴 버튼 처리
-        if text == "📋 키워드 목록":
-            logger.info(f"사용자 {user_id} - 키워드 목록 버튼 클릭")
-            await self.list_keywords_command(update, None)
-            return
-        elif text == "📰 즉시 뉴스 확인":
-            logger.info(f"사용자 {user_id} - 즉시 뉴스 확인 버튼 클릭")
-            await self.check_news_command(update, None)
-            return
-        elif text == "📊 주가 정보":
-            logger.info(f"사용자 {user_id} - 주가 정보 버튼 클릭")
-            await self.stock_info_command(update, None)
-            return
-        elif text == "🔕 방해금지 설정":
-            logger.info(f"사용자 {user_id} - 방해금지 설정 버튼 클릭")
-            await self.set_quiet_command(update, None)
+        # 메인 메뉴 버튼 처리 (dict 조회로 분기)
+        menu_handler = self._menu_routes.get(text)
+        if menu_handler:
+            logger.info(f"사용자 {user_id} - 메뉴 버튼 클릭: {text}")
+            await menu_handler(update, None)
             return
         
         # 사용자가 키워드 입력 대기 중인지 확인
@@ -964,36 +1049,18 @@ class TeleNewsBot:
                             except Exception as e:
                                 logger.error(f"입력 안내 메시지 삭제 실패: {e}")
                         
-                        # 3. 키워드 추가 실행
-                        added = []
-                        already_exist = []
-                        
-                        for keyword in keywords:
-                            if self.db.add_keyword(user_id, keyword):
-                                added.append(keyword)
-                                logger.info(f"사용자 {user_id} - 키워드 추가됨: {keyword}")
-                            else:
-                                already_exist.append(keyword)
+                        # 3. 키워드 일괄 추가 (트랜잭션/커밋 1회)
+                        added, already_exist = self.db.add_keywords(user_id, keywords)
+                        if added:
+                            logger.info(f"사용자 {user_id} - 키워드 추가됨: {', '.join(added)}")
                         
                         # 4. 업데이트된 전체 키워드 목록 가져오기
                         all_keywords = self.db.get_keywords(user_id)
                         
                         if all_keywords:
-                            keyword_list = '\n'.join([f"• {kw}" for kw in all_keywords])
-                            
-                            # 키워드 버튼 2열로 배치
-                            keyboard = []
-                            for i in range(0, len(all_keywords), 2):
-                                row = []
-                                row.append(InlineKeyboardButton(f"🗑️ {all_keywords[i]}", callback_data=f"remove:{all_keywords[i]}"))
-                                if i + 1 < len(all_keywords):
-                                    row.append(InlineKeyboardButton(f"🗑️ {all_keywords[i + 1]}", callback_data=f"remove:{all_keywords[i + 1]}"))
-                                keyboard.append(row)
-                            keyboard.append([InlineKeyboardButton("🗑️ 모두 삭제", callback_data="removeall")])
-                            keyboard.append([InlineKeyboardButton("📰 즉시 뉴스 확인", callback_data="check_news_now")])
-                            keyboard.append([InlineKeyboardButton("➕ 키워드 추가", callback_data="add_keyword")])
-                            reply_markup = InlineKeyboardMarkup(keyboard)
-                            
+                            # 목록 텍스트 + 키워드 버튼 (키워드 조합별 캐시, 2열 배치 + 공통 하단 버튼)
+                            keyword_list, reply_markup = self._render_keyword_list(all_keywords)
+
                             # 5. 성공 메시지 생성
                             result_msg = ""
                             if added:
@@ -1015,7 +1082,7 @@ class TeleNewsBot:
                                     chat_id=waiting_info['chat_id'],
                                     message_id=waiting_info['list_message_id'],
                                     text=f"{result_msg}📝 <b>등록된 키워드 목록:</b>\n\n{keyword_list}\n\n버튼을 눌러 삭제할 수 있습니다.",
-                                    parse_mode='HTML',
+                                    parse_mode=ParseMode.HTML,
                                     reply_markup=reply_markup
                                 )
                             else:
@@ -1025,7 +1092,7 @@ class TeleNewsBot:
                                 
                                 await update.message.reply_text(
                                     f"📝 <b>등록된 키워드 목록:</b>\n\n{keyword_list}\n\n버튼을 눌러 삭제할 수 있습니다.",
-                                    parse_mode='HTML',
+                                    parse_mode=ParseMode.HTML,
                                     reply_markup=reply_markup
                                 )
                         else:
@@ -1074,6 +1141,26 @@ class TeleNewsBot:
         except:
             pass  # 이미 삭제되었거나 삭제 권한이 없는 경우 무시
     
+    async def _get_stock_report_cached(self, user_id, nasdaq_alert_enabled):
+        """주가 리포트 조회 (TTL 캐시 + Lock으로 동시 요청을 한 번의 조회로 합침)"""
+        cache_key = bool(nasdaq_alert_enabled)
+        async with self._stock_report_lock:
+            cached = self._stock_report_cache.get(cache_key)
+            if cached and time.time() - cached[0] < self._stock_report_ttl:
+                return cached[1]
+
+            # 동기 함수를 별도 스레드에서 실행
+            report = await asyncio.to_thread(
+                self.stock_monitor.get_full_report_html,
+                user_id,
+                nasdaq_alert_enabled
+            )
+
+            # 실패 메시지는 캐시하지 않음 (다음 요청에서 재시도)
+            if not report.startswith('❌'):
+                self._stock_report_cache[cache_key] = (time.time(), report)
+            return report
+
     async def stock_info_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """주가 정보 확인"""
         user_id = update.effective_chat.id
@@ -1090,13 +1177,9 @@ class TeleNewsBot:
         
         # 나스닥 알림 설정 확인
         nasdaq_alert_enabled = self.db.get_nasdaq_alert_setting(user_id)
-        
-        # 동기 함수를 별도 스레드에서 실행 (나스닥 알림 상태 전달)
-        report = await asyncio.to_thread(
-            self.stock_monitor.get_full_report_html, 
-            user_id, 
-            nasdaq_alert_enabled
-        )
+
+        # 리포트 생성 (캐시 - 동시 요청 시 yfinance 호출 공유)
+        report = await self._get_stock_report_cached(user_id, nasdaq_alert_enabled)
         
         # 버튼 생성
         if nasdaq_alert_enabled:
@@ -1110,7 +1193,7 @@ class TeleNewsBot:
         reply_markup = InlineKeyboardMarkup(keyboard)
         
         # 결과 전송 (버튼 포함)
-        await update.message.reply_text(report, parse_mode='HTML', reply_markup=reply_markup)
+        await update.message.reply_text(report, parse_mode=ParseMode.HTML, reply_markup=reply_markup)
         
         # 로딩 메시지 삭제
         try:
@@ -1121,29 +1204,23 @@ class TeleNewsBot:
     async def check_news_updates(self):
         """뉴스 업데이트 확인 (스케줄러용 - 키워드 중복 제거 + 캐시 활용)"""
         try:
+            # 틱 단위의 큰 DB 작업은 별도 스레드에서 실행 (이벤트 루프가 폴링/전송을 계속 처리하도록)
             # 7일 이상 오래된 뉴스 기록 삭제
-            self.db.cleanup_old_news(days=7)
-            
-            # 1. 모든 사용자 키워드 수집
-            user_keywords = self.db.get_all_user_keywords_except_blocked()
-            
-            if not user_keywords:
+            await asyncio.to_thread(self.db.cleanup_old_news, 7)
+
+            # 1. 모든 사용자 키워드 수집 (SQL에서 사용자별로 그룹화, 등록 순서 유지)
+            user_keyword_map = await asyncio.to_thread(self.db.get_all_user_keywords_grouped)  # {user_id: [keyword1, ...]}
+
+            if not user_keyword_map:
                 return
-            
+
             # 2. 방해금지 시간이 아닌 사용자만 필터링 (API 호출 전 체크)
             active_user_keywords = []
             quiet_user_ids = set()
-            
-            from collections import defaultdict
-            user_keyword_map = defaultdict(list)  # {user_id: [keyword1, keyword2, ...]}
-            seen_keywords = set()  # 중복 키워드 방지
-            
-            for user_id, keyword in user_keywords:
-                # 사용자별로 키워드가 등록된 순서대로 유지
-                if (user_id, keyword) not in seen_keywords:
-                    user_keyword_map[user_id].append(keyword)
-                    seen_keywords.add((user_id, keyword))
-            
+
+            # 방해금지 설정을 한 번의 쿼리로 캐시에 적재한 뒤 메모리에서만 판정
+            await asyncio.to_thread(self._prewarm_quiet_hours_cache, user_keyword_map.keys())
+
             # 방해금지 시간 체크 (API 호출 전)
             for user_id, keywords in user_keyword_map.items():
                 if self.is_quiet_time(user_id):
@@ -1165,44 +1242,75 @@ class TeleNewsBot:
             unique_base_keywords, keyword_mapping = self.get_unique_base_keywords(active_user_keywords)
             
             # 4. 기본 키워드에 대해서만 API 호출 (AND 연산 키워드 제외)
+            # 키워드별 크롤링을 동시 실행 (세마포어로 동시 요청 수 제한 - API 부하 분산)
+            semaphore = asyncio.Semaphore(8)
+
+            async def crawl_keyword(base_kw):
+                async with semaphore:
+                    news_list = await self._fetch_latest_news(base_kw, 15)
+                    return base_kw, news_list
+
+            crawl_results = await asyncio.gather(
+                *(crawl_keyword(base_kw) for base_kw in unique_base_keywords),
+                return_exceptions=True
+            )
+
             base_news_map = {}
-            for base_kw in unique_base_keywords:
-                news_list = self.news_crawler.get_latest_news(base_kw, last_check_count=15)
+            for result in crawl_results:
+                if isinstance(result, BaseException):
+                    logger.error(f"키워드 크롤링 중 오류: {result}")
+                    continue
+                base_kw, news_list = result
                 base_news_map[base_kw] = news_list
-                await asyncio.sleep(0.5)  # API 부하 분산
             
-            # 5. 방해금지 시간이 아닌 사용자별로 처리
-            for user_id, keywords in user_keyword_map.items():
-                # 이미 방해금지 체크 완료했으므로 방해금지 사용자는 건너뜀
-                if user_id in quiet_user_ids:
-                    continue
-                
-                try:
-                    # 사용자의 모든 키워드에 대한 뉴스 수집 (복합연산 적용)
-                    # 키워드 순서 보장을 위해 순차적으로 처리
-                    for keyword in keywords:
-                        # 복합연산 적용
-                        combined_news = self.apply_operation(keyword, base_news_map)
-                        
-                        if combined_news:
-                            # 각 뉴스에 키워드 정보 추가
-                            for news in combined_news:
-                                news['_keyword'] = keyword
-                            
-                            # 개별 키워드별로 뉴스 전송 (자동 알림)
-                            # 이미 방해금지 체크 완료했으므로 manual_check=False로 전송
-                            await self._send_news_to_user(user_id, keyword, combined_news, manual_check=False)
-                            
-                            # 키워드 간 순서 보장을 위한 딜레이
-                            await asyncio.sleep(1.0)
-                    
-                except Exception as e:
-                    logger.error(f"사용자 {user_id} 처리 중 오류: {e}")
-                    import traceback
-                    logger.error(traceback.format_exc())
+            # 5. 복합연산/유사뉴스 필터링은 키워드 표현식별로 1회만 수행
+            # (같은 키워드를 등록한 사용자끼리 결과를 공유 - 사용자 수와 무관한 비용)
+            active_keywords = {keyword
+                               for user_id, keywords in user_keyword_map.items()
+                               if user_id not in quiet_user_ids
+                               for keyword in keywords}
+            combined_news_map = {}
+            for keyword in active_keywords:
+                combined_news_map[keyword] = await self.apply_operation(keyword, base_news_map)
+
+            # 6. 방해금지 시간이 아닌 사용자별로 처리
+            # 사용자 간에는 독립적이므로 동시 전송 (세마포어로 동시 사용자 수 제한)
+            send_semaphore = asyncio.Semaphore(20)
+
+            async def process_user(user_id, keywords):
+                async with send_semaphore:
+                    try:
+                        # 사용자의 모든 키워드에 대한 뉴스 수집 (복합연산 적용)
+                        # 키워드 순서 보장을 위해 사용자 안에서는 순차적으로 처리
+                        for keyword in keywords:
+                            # 사이클 시작 시 계산해 둔 공유 결과 사용
+                            combined_news = combined_news_map.get(keyword, [])
+
+                            if combined_news:
+                                # 각 뉴스에 키워드 정보 추가
+                                for news in combined_news:
+                                    news['_keyword'] = keyword
+
+                                # 개별 키워드별로 뉴스 전송 (자동 알림)
+                                # 틱 시작 시 계산한 방해금지 집합을 전달 (키워드마다 재평가 방지)
+                                await self._send_news_to_user(user_id, keyword, combined_news,
+                                                              manual_check=False, quiet_uids=quiet_user_ids)
+
+                                # 키워드 간 순서 보장을 위한 딜레이
+                                await asyncio.sleep(1.0)
+
+                    except Exception as e:
+                        logger.error(f"사용자 {user_id} 처리 중 오류: {e}")
+                        logger.error(traceback.format_exc())
+
+            # 이미 방해금지 체크 완료했으므로 방해금지 사용자는 건너뜀
+            await asyncio.gather(
+                *(process_user(user_id, keywords)
+                  for user_id, keywords in user_keyword_map.items()
+                  if user_id not in quiet_user_ids)
+            )
         except Exception as e:
             logger.error(f"뉴스 업데이트 체크 전체 오류: {e}")
-            import traceback
             logger.error(traceback.format_exc())
     
     async def _send_batch_news_to_user(self, user_id, news_by_keyword, manual_check=False):
@@ -1217,12 +1325,10 @@ class TeleNewsBot:
         total_new_news = 0
         
         for keyword, news_list in news_by_keyword.items():
-            # 새로운 뉴스만 필터링
-            new_news = []
-            for news in news_list:
-                if not self.db.is_news_sent(user_id, keyword, news['url']):
-                    new_news.append(news)
-            
+            # 새로운 뉴스만 필터링 (한 번의 조회로 전송 여부 일괄 확인)
+            sent_urls = self._get_sent_urls(user_id, keyword, [news['url'] for news in news_list])
+            new_news = [news for news in news_list if news['url'] not in sent_urls]
+
             if new_news:
                 # 날짜순으로 정렬 (최신 뉴스가 상단에 오도록)
                 new_news = self._sort_news_by_date(new_news)
@@ -1234,84 +1340,62 @@ class TeleNewsBot:
             logger.info(f"사용자 {user_id} - 새로운 뉴스 없음")
             return
         
-        # 통합 메시지 생성
-        message = f"📰 <b>새로운 뉴스 알림</b>\n"
-        message += f"총 {total_new_news}건 ({len(all_new_news)}개 키워드)\n"
-        message += "═══════════════\n\n"
-        
+        # 통합 메시지 생성 (문자열 누적 대신 리스트 조합 후 join)
+        parts = [
+            f"📰 <b>새로운 뉴스 알림</b>\n",
+            f"총 {total_new_news}건 ({len(all_new_news)}개 키워드)\n",
+            "═══════════════\n\n",
+        ]
+
         # 키워드별로 뉴스 추가
         for keyword, news_list in all_new_news.items():
-            message += f"🔍 <b>키워드: {keyword}</b> ({len(news_list)}건)\n"
-            message += "───────────────\n"
-            
-            for i, news in enumerate(news_list, 1):
+            parts.append(f"🔍 <b>키워드: {keyword}</b> ({len(news_list)}건)\n")
+            parts.append("───────────────\n")
+
+            for news in news_list:
                 title = news['title']
                 source = news['source']
                 date = self._format_date_simple(news['date'])
                 url = news['url']
                 similar_count = news.get('similar_count', 1)
-                
+
                 # 뉴스 아이콘 결정
                 icon = self._get_news_icon(news)
-                
+
                 # 제목 (아이콘 + 제목)
-                message += f"<a href='{url}'><b>{icon} {title}</b></a>"
-                
-                # 관련뉴스 개수 표시
-                if icon == '⭐':
-                    if similar_count >= 2:
-                        message += f" [관련뉴스: {similar_count}건]"
-                elif similar_count > 1:
-                    message += f" [관련뉴스: {similar_count}건]"
-                
-                message += "\n"
-                
+                parts.append(f"<a href='{url}'><b>{icon} {title}</b></a>")
+
+                # 관련뉴스 개수 표시 (2건 이상일 때만)
+                if similar_count >= 2:
+                    parts.append(f" [관련뉴스: {similar_count}건]")
+
+                parts.append("\n")
+
                 # 부가 정보
-                message += f"<code>{source}, {date}</code>\n"
-                message += "───────────────\n"
-            
-            message += "\n"
-        
+                parts.append(f"<code>{source}, {date}</code>\n")
+                parts.append("───────────────\n")
+
+            parts.append("\n")
+
+        message = "".join(parts)
+
         # 메시지 전송 시도
         success = await self.send_message_to_user(user_id, message)
         
         # 전송 성공한 경우에만 DB에 기록 및 메시지 저장
         if success:
             for keyword, news_list in all_new_news.items():
-                for news in news_list:
-                    self.db.mark_news_sent(user_id, keyword, news['url'], news['title'])
+                # 전송 기록 일괄 INSERT (커밋 1회)
+                self.db.mark_news_sent_many(user_id, keyword, news_list)
+                self._record_sent_urls(user_id, keyword, news_list)
                 
                 # 개별 키워드별 메시지 생성 및 DB 저장
-                keyword_message = f"📰 <b>새로운 뉴스</b> (키워드: {keyword})\n"
-                keyword_message += f"총 {len(news_list)}건\n"
-                keyword_message += "──────────────\n\n"
-                
-                for i, news in enumerate(news_list, 1):
-                    title = news['title']
-                    source = news['source']
-                    date = self._format_date_simple(news['date'])
-                    url = news['url']
-                    similar_count = news.get('similar_count', 1)
-                    
-                    # 뉴스 아이콘 결정
-                    icon = self._get_news_icon(news)
-                    
-                    # 제목 (아이콘 + 제목)
-                    keyword_message += f"<a href='{url}'><b>{icon} {title}</b></a>"
-                    
-                    # 관련뉴스 개수 표시
-                    if icon == '⭐':
-                        if similar_count >= 2:
-                            keyword_message += f" [관련뉴스: {similar_count}건]"
-                    elif similar_count > 1:
-                        keyword_message += f" [관련뉴스: {similar_count}건]"
-                    
-                    keyword_message += "\n\n"
-                    
-                    # 부가 정보
-                    keyword_message += f"<code>{source}, {date}</code>\n"
-                    keyword_message += "──────────────\n\n"
-                
+                keyword_message = (
+                    f"📰 <b>새로운 뉴스</b> (키워드: {keyword})\n"
+                    f"총 {len(news_list)}건\n"
+                    "──────────────\n\n"
+                ) + await self._format_news_items_async(news_list)
+
                 # 개별 키워드 메시지 DB 저장
                 self.db.save_last_message(user_id, keyword, keyword_message)
             
@@ -1322,20 +1406,13 @@ class TeleNewsBot:
     def _sort_news_by_date(self, news_list):
         """뉴스를 날짜순으로 정렬 (최신 뉴스가 상단)"""
         try:
-            from datetime import datetime
-            
             def parse_date(news):
-                """뉴스 날짜를 datetime 객체로 변환"""
+                """뉴스 날짜를 datetime 객체로 변환 (_format_date_simple과 같은 캐시 공유)"""
                 try:
-                    date_str = news['date']
-                    if '+' in date_str or '-' in date_str:
-                        dt = datetime.strptime(date_str, '%a, %d %b %Y %H:%M:%S %z')
-                    else:
-                        dt = datetime.strptime(date_str, '%a, %d %b %Y %H:%M:%S')
-                    return dt
+                    return _parse_news_date(news['date'])
                 except:
-                    return datetime.now()
-            
+                    return datetime.now(KST)
+
             # 날짜순 정렬 (최신 우선, 내림차순)
             sorted_news = sorted(news_list, key=parse_date, reverse=True)
             return sorted_news
@@ -1345,36 +1422,96 @@ class TeleNewsBot:
     
     def _get_news_icon(self, news):
         """뉴스 아이콘 결정 (유사 개수 및 특수 키워드 기반)"""
-        title = news.get('title', '')
-        similar_count = news.get('similar_count', 1)
-        
-        # 제목에 [단독], [속보], [긴급] 또는 (단독), (속보), (긴급) 포함 시 별표
-        special_keywords = ['[단독]', '[속보]', '[긴급]', '(단독)', '(속보)', '(긴급)']
-        if any(keyword in title for keyword in special_keywords):
-            return '⭐'
-        
-        # 유사 개수에 따른 아이콘
-        if similar_count >= 5:
-            return '🔥🔥'
-        elif similar_count >= 2:
-            return '🔥'
-        else:
-            return '🔹'  # 1건: 현재와 동일
-    
-    async def _send_news_to_user(self, user_id, keyword, news_list, manual_check=False):
-        """특정 사용자에게 뉴스 전송 (키워드별 최적화용)"""
-        
-        # 방해금지 시간 체크 (수동 확인 시에는 무시)
-        if not manual_check and self.is_quiet_time(user_id):
-            logger.info(f"사용자 {user_id} - 방해금지 시간, 뉴스 알림 건너뜀 ({keyword})")
-            return
-        
-        # 새로운 뉴스만 필터링
-        new_news = []
+        return _news_icon(news.get('title', ''), news.get('similar_count', 1))
+
+    def _format_news_items(self, news_list, manual_check=False, sent_urls=None):
+        """뉴스 목록을 메시지 본문으로 변환 (문자열 누적 대신 리스트 조합 후 join)"""
+        parts = []
         for news in news_list:
-            if not self.db.is_news_sent(user_id, keyword, news['url']):
-                new_news.append(news)
+            title = news['title']
+            source = news['source']
+            date = self._format_date_simple(news['date'])
+            url = news['url']
+            similar_count = news.get('similar_count', 1)
+
+            # 뉴스 아이콘 결정
+            icon = self._get_news_icon(news)
+
+            # 수동 확인일 때 새로운 뉴스 표시
+            new_indicator = ""
+            if manual_check and sent_urls is not None and url not in sent_urls:
+                new_indicator = "🆕 "
+
+            # 제목 (새로운 뉴스 표시 + 아이콘 + 제목)
+            parts.append(f"<a href='{url}'><b>{new_indicator}{icon} {title}</b></a>")
+
+            # 관련뉴스 개수 표시 (2건 이상일 때만)
+            if similar_count >= 2:
+                parts.append(f" [관련뉴스: {similar_count}건]")
+
+            parts.append("\n\n")
+
+            # 부가 정보는 작고 덜 눈에 띄게
+            parts.append(f"<code>{source}, {date}</code>\n")
+            parts.append("──────────────\n\n")
+
+        return "".join(parts)
+
+    async def _format_news_items_async(self, news_list, manual_check=False, sent_urls=None):
+        """뉴스 목록 렌더링 (대량이면 스레드로 오프로드해 이벤트 루프 블로킹 방지)"""
+        if len(news_list) > 8:
+            return await asyncio.to_thread(
+                self._format_news_items, news_list, manual_check, sent_urls
+            )
+        return self._format_news_items(news_list, manual_check, sent_urls)
+
+    def _get_sent_urls(self, user_id, keyword, urls):
+        """후보 URL 중 이미 전송된 것 조회 (인메모리 캐시 - 첫 조회 시 DB에서 예열)"""
+        cache_key = (user_id, keyword)
+        cached = self._sent_urls_cache.get(cache_key)
+        if cached is None:
+            cached = self.db.get_recent_sent_urls(user_id, keyword)
+            self._sent_urls_cache[cache_key] = cached
+        return cached.intersection(urls)
+
+    def _record_sent_urls(self, user_id, keyword, news_list):
+        """전송 완료 기록을 인메모리 캐시에도 반영 (DB 기록과 동기화 유지)"""
+        cached = self._sent_urls_cache.get((user_id, keyword))
+        if cached is not None:
+            cached.update(news['url'] for news in news_list)
+
+    async def _fetch_latest_news(self, keyword, last_check_count=15):
+        """네이버 뉴스 조회 (전역 토큰 버킷으로 속도 제한, 블로킹 호출은 스레드로 오프로드)"""
+        async with self._crawler_limiter:
+            return await asyncio.to_thread(
+                self.news_crawler.get_latest_news, keyword, last_check_count
+            )
+
+    async def _prefetch_base_news(self, base_keywords, last_check_count=15):
+        """기본 키워드들의 뉴스를 동시 수집 (순차 대기 대신 API 한도 내 병렬 호출)"""
+        results = await asyncio.gather(
+            *(self._fetch_latest_news(base_kw, last_check_count)
+              for base_kw in base_keywords)
+        )
+        return dict(zip(base_keywords, results))
+
+    async def _send_news_to_user(self, user_id, keyword, news_list, manual_check=False, quiet_uids=None):
+        """특정 사용자에게 뉴스 전송 (키워드별 최적화용)
+
+        :param quiet_uids: 스케줄러 틱 시작 시 미리 계산한 방해금지 사용자 집합
+                           (전달되면 키워드마다 is_quiet_time을 재평가하지 않음)
+        """
+        # 방해금지 시간 체크 (수동 확인 시에는 무시)
+        if not manual_check:
+            is_quiet = user_id in quiet_uids if quiet_uids is not None else self.is_quiet_time(user_id)
+            if is_quiet:
+                logger.info(f"사용자 {user_id} - 방해금지 시간, 뉴스 알림 건너뜀 ({keyword})")
+                return
         
+        # 새로운 뉴스만 필터링 (한 번의 쿼리로 전송 여부 일괄 확인)
+        sent_urls = self._get_sent_urls(user_id, keyword, [news['url'] for news in news_list])
+        new_news = [news for news in news_list if news['url'] not in sent_urls]
+
         # 디버깅: 뉴스 필터링 결과 로그 (수동확인 또는 새로운 뉴스가 있을 때만)
         if manual_check or len(new_news) > 0:
             logger.info(f"사용자 {user_id} - 키워드 '{keyword}': API에서 {len(news_list)}개, 새로운 뉴스 {len(new_news)}개")
@@ -1384,21 +1521,24 @@ class TeleNewsBot:
             # 수동 확인일 때만 이미 본 뉴스로 채우기 시도
             if manual_check and len(news_list) > 0:
                 base_keywords = self.normalize_keyword(keyword)
-                additional_news = self._get_additional_news(user_id, keyword, base_keywords, 15)
+                additional_news = await self._get_additional_news(user_id, keyword, base_keywords, 15)
                 if additional_news:
+                    # 이미 본 뉴스로 채운 항목은 전송 기록이 있는 뉴스
+                    sent_urls.update(news['url'] for news in additional_news)
                     new_news = additional_news
                 else:
                     logger.warning(f"사용자 {user_id} - 키워드 '{keyword}': 추가할 이미 본 뉴스 없음")
-        
+
         # 새 뉴스를 날짜순으로 정렬 (최신 뉴스가 상단에 오도록)
         if new_news:
             new_news = self._sort_news_by_date(new_news)
-            
+
             # 새 뉴스가 15개 미만이면 수동 확인일 때만 이미 본 뉴스로 채우기
             if len(new_news) < 15 and manual_check:
                 base_keywords = self.normalize_keyword(keyword)
-                additional_news = self._get_additional_news(user_id, keyword, base_keywords, 15 - len(new_news))
+                additional_news = await self._get_additional_news(user_id, keyword, base_keywords, 15 - len(new_news))
                 if additional_news:
+                    sent_urls.update(news['url'] for news in additional_news)
                     new_news.extend(additional_news)
                     new_news = self._sort_news_by_date(new_news)
         
@@ -1408,55 +1548,26 @@ class TeleNewsBot:
             total_similar = sum(news.get('similar_count', 1) for news in new_news)
             
             # 새로운 뉴스와 이미 본 뉴스 구분
-            new_count = len([news for news in new_news if not self.db.is_news_sent(user_id, keyword, news['url'])])
+            new_count = len([news for news in new_news if news['url'] not in sent_urls])
             seen_count = len(new_news) - new_count
             
             if seen_count > 0:
-                message = f"📰 <b>새로운 뉴스</b> (키워드: {keyword})\n"
-                message += f"새로운 뉴스 {new_count}건 + 이미 본 뉴스 {seen_count}건 = 총 {len(new_news)}건\n"
+                header = (f"📰 <b>새로운 뉴스</b> (키워드: {keyword})\n"
+                          f"새로운 뉴스 {new_count}건 + 이미 본 뉴스 {seen_count}건 = 총 {len(new_news)}건\n")
             else:
-                message = f"📰 <b>새로운 뉴스</b> (키워드: {keyword})\n"
-                message += f"총 {len(new_news)}건\n"
-            message += "──────────────\n\n"
-            
-            for i, news in enumerate(new_news, 1):
-                title = news['title']
-                source = news['source']
-                date = self._format_date_simple(news['date'])
-                url = news['url']
-                similar_count = news.get('similar_count', 1)
-                
-                # 뉴스 아이콘 결정
-                icon = self._get_news_icon(news)
-                
-                # 수동 확인일 때 새로운 뉴스 표시
-                is_new_news = not self.db.is_news_sent(user_id, keyword, news['url'])
-                new_indicator = "🆕 " if manual_check and is_new_news else ""
-                
-                # 제목 (새로운 뉴스 표시 + 아이콘 + 제목)
-                message += f"<a href='{url}'><b>{new_indicator}{icon} {title}</b></a>"
-                
-                # 관련뉴스 개수 표시
-                # ⭐(단독/속보/긴급)는 2건 이상일 때만, 다른 아이콘은 2건 이상일 때 표시
-                if icon == '⭐':
-                    if similar_count >= 2:
-                        message += f" [관련뉴스: {similar_count}건]"
-                elif similar_count > 1:
-                    message += f" [관련뉴스: {similar_count}건]"
-                
-                message += "\n\n"
-                
-                # 부가 정보는 작고 덜 눈에 띄게
-                message += f"<code>{source}, {date}</code>\n"
-                message += "──────────────\n\n"
-            
+                header = (f"📰 <b>새로운 뉴스</b> (키워드: {keyword})\n"
+                          f"총 {len(new_news)}건\n")
+            header += "──────────────\n\n"
+
+            message = header + await self._format_news_items_async(new_news, manual_check=manual_check, sent_urls=sent_urls)
+
             # 메시지 전송 시도
             success = await self.send_message_to_user(user_id, message)
             
             # 전송 성공한 경우에만 DB에 기록 및 메시지 저장
             if success:
-                for news in new_news:
-                    self.db.mark_news_sent(user_id, keyword, news['url'], news['title'])
+                self.db.mark_news_sent_many(user_id, keyword, new_news)
+                self._record_sent_urls(user_id, keyword, new_news)
                 # 직전 메시지 DB 저장 (수동 확인용)
                 self.db.save_last_message(user_id, keyword, message)
             else:
@@ -1467,43 +1578,18 @@ class TeleNewsBot:
                 # 수동 확인일 때만 이미 본 뉴스로 채우기 시도
                 logger.info(f"사용자 {user_id} - 키워드 '{keyword}': 새로운 뉴스 0개, 수동확인으로 이미 본 뉴스로 채우기 시도")
                 base_keywords = self.normalize_keyword(keyword)
-                additional_news = self._get_additional_news(user_id, keyword, base_keywords, 15)
+                additional_news = await self._get_additional_news(user_id, keyword, base_keywords, 15)
                 if additional_news:
                     new_news = additional_news
                     logger.info(f"사용자 {user_id} - 키워드 '{keyword}': 이미 본 뉴스 {len(additional_news)}개 추가")
                     
                     # 이미 본 뉴스로 메시지 생성
-                    message = f"📰 <b>최신 뉴스</b> (키워드: {keyword})\n"
-                    message += f"💡 <i>이미 확인한 뉴스입니다.</i>\n"
-                    message += f"총 {len(new_news)}건\n"
-                    message += "──────────────\n\n"
-                    
-                    for i, news in enumerate(new_news, 1):
-                        title = news['title']
-                        source = news['source']
-                        date = self._format_date_simple(news['date'])
-                        url = news['url']
-                        similar_count = news.get('similar_count', 1)
-                        
-                        # 뉴스 아이콘 결정
-                        icon = self._get_news_icon(news)
-                        
-                        # 제목 (아이콘 + 제목)
-                        message += f"<a href='{url}'><b>{icon} {title}</b></a>"
-                        
-                        # 관련뉴스 개수 표시
-                        if icon == '⭐':
-                            if similar_count >= 2:
-                                message += f" [관련뉴스: {similar_count}건]"
-                        elif similar_count > 1:
-                            message += f" [관련뉴스: {similar_count}건]"
-                        
-                        message += "\n\n"
-                        
-                        # 부가 정보
-                        message += f"<code>{source}, {date}</code>\n"
-                        message += "──────────────\n\n"
-                    
+                    header = (f"📰 <b>최신 뉴스</b> (키워드: {keyword})\n"
+                              f"💡 <i>이미 확인한 뉴스입니다.</i>\n"
+                              f"총 {len(new_news)}건\n"
+                              "──────────────\n\n")
+                    message = header + await self._format_news_items_async(new_news)
+
                     # 메시지 전송 (DB에는 저장하지 않음 - 이미 본 뉴스이므로)
                     success = await self.send_message_to_user(user_id, message)
                     if success:
@@ -1516,34 +1602,25 @@ class TeleNewsBot:
                 # 자동 알림일 때는 새로운 뉴스가 없으면 아무것도 보내지 않음
                 logger.info(f"사용자 {user_id} - 키워드 '{keyword}': 새로운 뉴스 없음으로 전송하지 않음 (자동알림)")
     
-    def _get_additional_news(self, user_id, keyword, base_keywords, needed_count):
+    async def _get_additional_news(self, user_id, keyword, base_keywords, needed_count):
         """이미 본 뉴스 중에서 부족한 만큼 추가 뉴스 선택"""
         try:
-            # 기본 키워드들의 뉴스 수집
-            all_news = []
-            for base_kw in base_keywords:
-                news_list = self.news_crawler.get_latest_news(base_kw, last_check_count=50)  # 더 많이 가져오기
-                all_news.extend(news_list)
-            
+            # 기본 키워드들의 뉴스 수집 (동시 수집, 더 많이 가져오기)
+            base_news = await self._prefetch_base_news(base_keywords, 50)
+            all_news = [news for base_kw in base_keywords for news in base_news[base_kw]]
+
             if not all_news:
                 return []
             
             # 중복 제거
-            seen_urls = set()
-            unique_news = []
-            for news in all_news:
-                if news['url'] not in seen_urls:
-                    unique_news.append(news)
-                    seen_urls.add(news['url'])
-            
+            unique_news = self._remove_duplicates(all_news)
+
             # 날짜순으로 정렬 (최신 뉴스가 상단에 오도록)
             unique_news = self._sort_news_by_date(unique_news)
             
-            # 이미 본 뉴스만 필터링
-            seen_news = []
-            for news in unique_news:
-                if self.db.is_news_sent(user_id, keyword, news['url']):
-                    seen_news.append(news)
+            # 이미 본 뉴스만 필터링 (한 번의 조회로 전송 여부 일괄 확인)
+            sent_urls = self._get_sent_urls(user_id, keyword, [news['url'] for news in unique_news])
+            seen_news = [news for news in unique_news if news['url'] in sent_urls]
             
             # 부족한 만큼만 선택
             additional_news = seen_news[:needed_count]
@@ -1575,13 +1652,8 @@ class TeleNewsBot:
             return
         
         # 중복 제거
-        seen_urls = set()
-        unique_news = []
-        for news in all_news:
-            if news['url'] not in seen_urls:
-                unique_news.append(news)
-                seen_urls.add(news['url'])
-        
+        unique_news = self._remove_duplicates(all_news)
+
         # 날짜순으로 정렬 (최신 뉴스가 상단에 오도록)
         unique_news = self._sort_news_by_date(unique_news)
         
@@ -1589,37 +1661,13 @@ class TeleNewsBot:
         latest_news = unique_news[:15]
         
         # 메시지 생성
-        message = f"📰 <b>최신 뉴스</b> (키워드: {keyword})\n"
-        message += f"💡 <i>이미 확인한 뉴스입니다.</i>\n"
-        message += f"총 {len(latest_news)}건\n"
-        message += "──────────────\n\n"
-        
-        for i, news in enumerate(latest_news, 1):
-            title = news['title']
-            source = news['source']
-            date = self._format_date_simple(news['date'])
-            url = news['url']
-            similar_count = news.get('similar_count', 1)
-            
-            # 뉴스 아이콘 결정
-            icon = self._get_news_icon(news)
-            
-            # 제목 (아이콘 + 제목)
-            message += f"<a href='{url}'><b>{icon} {title}</b></a>"
-            
-            # 관련뉴스 개수 표시
-            if icon == '⭐':
-                if similar_count >= 2:
-                    message += f" [관련뉴스: {similar_count}건]"
-            elif similar_count > 1:
-                message += f" [관련뉴스: {similar_count}건]"
-            
-            message += "\n\n"
-            
-            # 부가 정보
-            message += f"<code>{source}, {date}</code>\n"
-            message += "──────────────\n\n"
-        
+        message = (
+            f"📰 <b>최신 뉴스</b> (키워드: {keyword})\n"
+            f"💡 <i>이미 확인한 뉴스입니다.</i>\n"
+            f"총 {len(latest_news)}건\n"
+            "──────────────\n\n"
+        ) + await self._format_news_items_async(latest_news)
+
         # 메시지 전송 (DB에는 저장하지 않음 - 이미 본 뉴스이므로)
         success = await self.send_message_to_user(user_id, message)
         if success:
@@ -1635,33 +1683,23 @@ class TeleNewsBot:
             return
         
         try:
-            # 기본 키워드들의 뉴스 수집
-            all_news = []
-            for base_kw in base_keywords:
-                news_list = self.news_crawler.get_latest_news(base_kw, last_check_count=50)  # 더 많이 가져오기
-                all_news.extend(news_list)
-                await asyncio.sleep(0.5)  # API 부하 분산
-            
+            # 기본 키워드들의 뉴스 수집 (동시 수집, 더 많이 가져오기)
+            base_news = await self._prefetch_base_news(base_keywords, 50)
+            all_news = [news for base_kw in base_keywords for news in base_news[base_kw]]
+
             if not all_news:
                 await self.send_message_to_user(user_id, f"📰 '{keyword}' 키워드에 대한 뉴스를 찾을 수 없습니다.")
                 return
             
             # 중복 제거
-            seen_urls = set()
-            unique_news = []
-            for news in all_news:
-                if news['url'] not in seen_urls:
-                    unique_news.append(news)
-                    seen_urls.add(news['url'])
-            
+            unique_news = self._remove_duplicates(all_news)
+
             # 날짜순으로 정렬 (최신 뉴스가 상단에 오도록)
             unique_news = self._sort_news_by_date(unique_news)
             
-            # 이미 본 뉴스만 필터링
-            seen_news = []
-            for news in unique_news:
-                if self.db.is_news_sent(user_id, keyword, news['url']):
-                    seen_news.append(news)
+            # 이미 본 뉴스만 필터링 (한 번의 조회로 전송 여부 일괄 확인)
+            sent_urls = self._get_sent_urls(user_id, keyword, [news['url'] for news in unique_news])
+            seen_news = [news for news in unique_news if news['url'] in sent_urls]
             
             if not seen_news:
                 await self.send_message_to_user(user_id, f"📰 '{keyword}' 키워드에 대한 뉴스를 찾을 수 없습니다.")
@@ -1671,37 +1709,13 @@ class TeleNewsBot:
             latest_news = seen_news[:15]
             
             # 메시지 생성
-            message = f"📰 <b>최신 뉴스</b> (키워드: {keyword})\n"
-            message += f"💡 <i>이미 확인한 뉴스입니다.</i>\n"
-            message += f"총 {len(latest_news)}건\n"
-            message += "──────────────\n\n"
-            
-            for i, news in enumerate(latest_news, 1):
-                title = news['title']
-                source = news['source']
-                date = self._format_date_simple(news['date'])
-                url = news['url']
-                similar_count = news.get('similar_count', 1)
-                
-                # 뉴스 아이콘 결정
-                icon = self._get_news_icon(news)
-                
-                # 제목 (아이콘 + 제목)
-                message += f"<a href='{url}'><b>{icon} {title}</b></a>"
-                
-                # 관련뉴스 개수 표시
-                if icon == '⭐':
-                    if similar_count >= 2:
-                        message += f" [관련뉴스: {similar_count}건]"
-                elif similar_count > 1:
-                    message += f" [관련뉴스: {similar_count}건]"
-                
-                message += "\n\n"
-                
-                # 부가 정보
-                message += f"<code>{source}, {date}</code>\n"
-                message += "──────────────\n\n"
-            
+            message = (
+                f"📰 <b>최신 뉴스</b> (키워드: {keyword})\n"
+                f"💡 <i>이미 확인한 뉴스입니다.</i>\n"
+                f"총 {len(latest_news)}건\n"
+                "──────────────\n\n"
+            ) + await self._format_news_items_async(latest_news)
+
             # 메시지 전송 (DB에는 저장하지 않음 - 이미 본 뉴스이므로)
             success = await self.send_message_to_user(user_id, message)
             if not success:
@@ -1729,15 +1743,12 @@ class TeleNewsBot:
                     
                     # 2. 각 기본 키워드의 뉴스 수집 (AND 연산 키워드 제외)
                     base_news_map = {}
-                    if " and " not in keyword.lower():
-                        # AND 연산이 아닌 경우만 기본 키워드 호출
-                        for base_kw in base_keywords:
-                            news_list = self.news_crawler.get_latest_news(base_kw, last_check_count=15)
-                            base_news_map[base_kw] = news_list
-                            await asyncio.sleep(0.5)  # API 부하 분산
+                    if _keyword_operator(keyword) != "and":
+                        # AND 연산이 아닌 경우만 기본 키워드 호출 (동시 수집)
+                        base_news_map = await self._prefetch_base_news(base_keywords, 15)
                     
                     # 3. 복합연산 적용
-                    combined_news = self.apply_operation(keyword, base_news_map)
+                    combined_news = await self.apply_operation(keyword, base_news_map)
                     
                     if combined_news:
                         # 4. 새로운 뉴스가 있으면 전송 + DB 저장
@@ -1770,7 +1781,7 @@ class TeleNewsBot:
             return
         
         # 네이버 최신 뉴스 (15개) 가져오기
-        news_list = self.news_crawler.get_latest_news(keyword, last_check_count=15)
+        news_list = await self._fetch_latest_news(keyword, 15)
         
         if not news_list:
             if manual_check:
@@ -1780,12 +1791,10 @@ class TeleNewsBot:
                 )
             return
         
-        # 새로운 뉴스만 필터링
-        new_news = []
-        for news in news_list:
-            if not self.db.is_news_sent(user_id, keyword, news['url']):
-                new_news.append(news)
-        
+        # 새로운 뉴스만 필터링 (한 번의 쿼리로 전송 여부 일괄 확인)
+        sent_urls = self._get_sent_urls(user_id, keyword, [news['url'] for news in news_list])
+        new_news = [news for news in news_list if news['url'] not in sent_urls]
+
         # 새 뉴스를 날짜순으로 정렬 (최신 뉴스가 상단에 오도록)
         if new_news:
             new_news = self._sort_news_by_date(new_news)
@@ -1795,44 +1804,18 @@ class TeleNewsBot:
             # 총 관련 기사 수 계산
             total_similar = sum(news.get('similar_count', 1) for news in new_news)
             
-            message = f"📰 <b>새로운 뉴스</b> (키워드: {keyword})\n"
-            message += f"총 {len(new_news)}건\n"
-            message += "──────────────\n\n"
-            
-            for i, news in enumerate(new_news, 1):
-                title = news['title']
-                source = news['source']
-                date = self._format_date_simple(news['date'])
-                url = news['url']
-                similar_count = news.get('similar_count', 1)
-                
-                # 뉴스 아이콘 결정
-                icon = self._get_news_icon(news)
-                
-                # 제목 (아이콘 + 제목)
-                message += f"<a href='{url}'><b>{icon} {title}</b></a>"
-                
-                # 관련뉴스 개수 표시
-                # ⭐(단독/속보/긴급)는 2건 이상일 때만, 다른 아이콘은 2건 이상일 때 표시
-                if icon == '⭐':
-                    if similar_count >= 2:
-                        message += f" [관련뉴스: {similar_count}건]"
-                elif similar_count > 1:
-                    message += f" [관련뉴스: {similar_count}건]"
-                
-                message += "\n\n"
-                
-                # 부가 정보는 작고 덜 눈에 띄게
-                message += f"<code>{source}, {date}</code>\n"
-                message += "──────────────\n\n"
-            
+            header = (f"📰 <b>새로운 뉴스</b> (키워드: {keyword})\n"
+                      f"총 {len(new_news)}건\n"
+                      "──────────────\n\n")
+            message = header + await self._format_news_items_async(new_news)
+
             # 메시지 전송 시도
             success = await self.send_message_to_user(user_id, message)
             
             # 전송 성공한 경우에만 DB에 기록
             if success:
-                for news in new_news:
-                    self.db.mark_news_sent(user_id, keyword, news['url'], news['title'])
+                self.db.mark_news_sent_many(user_id, keyword, new_news)
+                self._record_sent_urls(user_id, keyword, new_news)
                 logger.info(f"사용자 {user_id} - 키워드 '{keyword}': {len(new_news)}개의 새 뉴스 전송 성공")
             else:
                 logger.warning(f"사용자 {user_id} - 키워드 '{keyword}': 뉴스 전송 실패, DB 기록 안 함 (다음에 재시도)")
@@ -1843,38 +1826,12 @@ class TeleNewsBot:
             sorted_news_list = self._sort_news_by_date(news_list)
             total_similar = sum(news.get('similar_count', 1) for news in sorted_news_list)
             
-            message = f"📰 <b>최신 뉴스</b> (키워드: {keyword})\n"
-            message += f"💡 <i>이미 확인한 뉴스입니다.</i>\n"
-            message += f"총 {len(sorted_news_list)}건\n"
-            message += "──────────────\n\n"
-            
-            for i, news in enumerate(sorted_news_list, 1):
-                title = news['title']
-                source = news['source']
-                date = self._format_date_simple(news['date'])
-                url = news['url']
-                similar_count = news.get('similar_count', 1)
-                
-                # 뉴스 아이콘 결정
-                icon = self._get_news_icon(news)
-                
-                # 제목 (아이콘 + 제목)
-                message += f"<a href='{url}'><b>{icon} {title}</b></a>"
-                
-                # 관련뉴스 개수 표시
-                # ⭐(단독/속보/긴급)는 2건 이상일 때만, 다른 아이콘은 2건 이상일 때 표시
-                if icon == '⭐':
-                    if similar_count >= 2:
-                        message += f" [관련뉴스: {similar_count}건]"
-                elif similar_count > 1:
-                    message += f" [관련뉴스: {similar_count}건]"
-                
-                message += "\n\n"
-                
-                # 부가 정보는 작고 덜 눈에 띄게
-                message += f"<code>{source}, {date}</code>\n"
-                message += "──────────────\n\n"
-            
+            header = (f"📰 <b>최신 뉴스</b> (키워드: {keyword})\n"
+                      f"💡 <i>이미 확인한 뉴스입니다.</i>\n"
+                      f"총 {len(sorted_news_list)}건\n"
+                      "──────────────\n\n")
+            message = header + await self._format_news_items_async(sorted_news_list)
+
             # 메시지 전송 (DB에는 기록하지 않음 - 이미 기록되어 있음)
             await self.send_message_to_user(user_id, message)
             logger.info(f"사용자 {user_id} - 키워드 '{keyword}': 수동 확인, 기존 뉴스 {len(news_list)}개 표시")
@@ -1882,37 +1839,19 @@ class TeleNewsBot:
     def _format_date_simple(self, date_str):
         """날짜 포맷 변환 (간소화 + 몇 분 전)"""
         try:
-            from datetime import datetime, timezone, timedelta
-            
             # "Sat, 18 Oct 2025 10:40:00 +0900" 형식 파싱
-            if '+' in date_str:
-                # +0900 부분 추출
-                parts = date_str.rsplit('+', 1)
-                dt_str = parts[0].strip()
-                tz_str = parts[1].strip()
-                
-                # 시간대 정보 파싱 (+0900 = KST)
-                tz_hours = int(tz_str[:2])
-                tz_minutes = int(tz_str[2:]) if len(tz_str) > 2 else 0
-                tz = timezone(timedelta(hours=tz_hours, minutes=tz_minutes))
-                
-                # 날짜 파싱
-                dt = datetime.strptime(dt_str, "%a, %d %b %Y %H:%M:%S")
-                dt = dt.replace(tzinfo=tz)
-            else:
-                dt = datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S")
-                dt = dt.replace(tzinfo=timezone(timedelta(hours=9)))  # KST
-            
+            # (strptime 대신 C로 구현된 email.utils 파서 + 캐시 사용)
+            dt = _parse_news_date(date_str)
+
             # 현재 시간 (KST)
-            now = datetime.now(timezone(timedelta(hours=9)))
-            
+            now = datetime.now(KST)
+
             # 시간 차이 계산
             diff = now - dt
             minutes_ago = int(diff.total_seconds() / 60)
-            
+
             # 요일 한글 변환
-            weekday_kr = ['월', '화', '수', '목', '금', '토', '일']
-            weekday = weekday_kr[dt.weekday()]
+            weekday = WEEKDAY_KR[dt.weekday()]
             
             # 포맷: 10.18(토) 10:50(6분전)
             if minutes_ago < 1:
@@ -1929,7 +1868,7 @@ class TeleNewsBot:
             return f"{dt.month}.{dt.day}({weekday}) {dt.strftime('%H:%M')}({time_ago})"
             
         except Exception as e:
-            print(f"[DEBUG] 날짜 파싱 오류: {e}")
+            logger.debug("날짜 파싱 오류: %s", e)
             # 파싱 실패 시 원본 반환
             return date_str.split('+')[0].strip() if '+' in date_str else date_str
     
@@ -1945,8 +1884,14 @@ class TeleNewsBot:
     async def check_stock_drop_alerts(self):
         """주가 하락 알림 체크 (전날 장중 최저가 기준, 오전 10시 실행)"""
         try:
+            # 미국 장이 열리지 않은 날 다음날 아침(한국 일/월요일)은 새 데이터가 없으므로 건너뜀
+            # (금요일 장은 한국 토요일 아침에 이미 처리됨)
+            if datetime.now(KST).weekday() in (6, 0):
+                logger.info("전날 미국 장 휴장 (주말) - 주가 하락 알림 체크 건너뜀")
+                return
+
             logger.info("=== 주가 하락 알림 체크 시작 (전날 장중 최저가 기준) ===")
-            
+
             # 전날 나스닥 장중 최저가 정보 가져오기 (동기 함수를 별도 스레드에서 실행)
             nasdaq_info = await asyncio.to_thread(self.stock_monitor.get_previous_day_low)
             if not nasdaq_info:
@@ -1964,171 +1909,156 @@ class TeleNewsBot:
             # 하락률에 따른 레벨 계산 (1%p 단위, 5% 이상만)
             # 5.0~5.9%: 레벨 5, 6.0~6.9%: 레벨 6, 7.0~7.9%: 레벨 7, ...
             current_level = int(drop_percentage)
-            
+
+            # 5% 미만 하락이면 알림 대상이 없으므로 사용자 순회 없이 종료
+            # (방해금지 중 쌓인 대기 알림은 quiet:off 콜백에서 별도로 전송됨)
+            if current_level < 5:
+                logger.info(f"전고점 대비 {drop_percentage:.2f}% 하락 (5% 미만) - 알림 없이 종료")
+                return
+
             # 모든 사용자에게 알림
-            all_users = self.db.get_all_users()
+            all_users = await asyncio.to_thread(self.db.get_all_users)
             logger.info(f"{len(all_users)}명의 사용자에게 알림 확인")
-            
+
+            # 사용자별 설정을 일괄 조회 (루프 안에서 사용자마다 SELECT하지 않도록)
+            # 일괄 쿼리는 별도 스레드에서 실행해 이벤트 루프를 막지 않음
+            nasdaq_settings = await asyncio.to_thread(self.db.get_nasdaq_alert_settings, all_users)
+            last_alerts = await asyncio.to_thread(self.db.get_last_stock_alert_levels, all_users)
+            await asyncio.to_thread(self._prewarm_quiet_hours_cache, all_users)
+
+            # 모든 사용자에게 동일한 내용이므로 TQQQ 조회/시나리오 계산은 루프 밖에서 1회만
+            tqqq_info = await asyncio.to_thread(self.stock_monitor.get_tqqq_info)
+            if not tqqq_info:
+                logger.warning("TQQQ 정보를 가져올 수 없습니다. 주가 알림 건너뜀")
+                return
+            # 전날 최저가를 current_price로 사용 (하락률 계산용)
+            nasdaq_info_for_alert = nasdaq_info.copy()
+            nasdaq_info_for_alert['current_price'] = nasdaq_info['low_price']
+            scenarios = self.stock_monitor.calculate_tqqq_scenarios(
+                nasdaq_info_for_alert['current_price'],
+                nasdaq_info_for_alert['all_time_high'],
+                tqqq_info['current_price']
+            )
+
+            # 전고점이 변경되었거나, 레벨이 올라갔을 때만 알림 (각 레벨당 최초 1회)
+            def should_alert(last_alert):
+                if last_alert is None or last_alert['ath_price'] != ath_price:
+                    # 새로운 전고점 또는 첫 알림
+                    return True
+                # 기존 전고점에서 하락 레벨이 증가 (예: 5% → 10%)
+                return current_level > last_alert['last_level']
+
+            # 대상 사용자 필터링 (알림 비활성화/레벨 미달/방해금지 제외) - 전부 인메모리 판정
+            eligible = []
+            pending_rows = []  # 방해금지 사용자는 모아서 한 트랜잭션으로 저장
             for user_id in all_users:
-                try:
-                    # 나스닥 알림 설정 확인
-                    nasdaq_alert_enabled = self.db.get_nasdaq_alert_setting(user_id)
-                    if not nasdaq_alert_enabled:
-                        logger.info(f"사용자 {user_id} - 나스닥 알림 비활성화, 건너뜀")
-                        continue
-                    
-                    # 마지막 알림 레벨 확인
-                    last_alert = self.db.get_last_stock_alert_level(user_id)
-                    
-                    # 전고점이 변경되었거나, 레벨이 올라갔을 때만 알림 (각 레벨당 최초 1회)
-                    should_alert = False
-                    if last_alert is None or last_alert['ath_price'] != ath_price:
-                        # 새로운 전고점 또는 첫 알림
-                        if current_level >= 5:  # 5% 이상 하락 시에만 알림
-                            should_alert = True
-                    elif current_level > last_alert['last_level'] and current_level >= 5:
-                        # 기존 전고점에서 하락 레벨이 증가 (예: 5% → 10%)
-                        should_alert = True
-                    
-                    if not should_alert:
-                        continue
-                    
-                    # 방해금지 시간 체크
-                    if self.is_quiet_time(user_id):
-                        logger.info(f"사용자 {user_id} - 방해금지 시간, 주가 알림 대기 중 ({current_level}% 하락)")
-                        # DB에 pending 상태로 저장 (방해금지 해제 시 전송)
-                        self.db.set_pending_stock_alert(user_id, current_level, ath_price, ath_date, nasdaq_info)
-                        continue
-                    
-                    # 알림 전송 및 성공 시에만 DB 업데이트
-                    # 전날 최저가를 current_price로 사용 (하락률 계산용)
-                    nasdaq_info_for_alert = nasdaq_info.copy()
-                    nasdaq_info_for_alert['current_price'] = nasdaq_info['low_price']
-                    success = await self._send_drop_alert(user_id, current_level, nasdaq_info_for_alert)
-                    if success:
-                        self.db.update_stock_alert_level(user_id, current_level, ath_price, ath_date)
-                    else:
+                # 나스닥 알림 설정 확인
+                if not nasdaq_settings.get(user_id, True):
+                    logger.info(f"사용자 {user_id} - 나스닥 알림 비활성화, 건너뜀")
+                    continue
+
+                if not should_alert(last_alerts.get(user_id)):
+                    continue
+
+                # 방해금지 시간 체크
+                if self.is_quiet_time(user_id):
+                    logger.info(f"사용자 {user_id} - 방해금지 시간, 주가 알림 대기 중 ({current_level}% 하락)")
+                    # DB에 pending 상태로 저장 (방해금지 해제 시 전송)
+                    pending_rows.append((user_id, current_level, ath_price, ath_date, nasdaq_info))
+                    continue
+
+                eligible.append(user_id)
+
+            await asyncio.to_thread(self.db.set_pending_stock_alerts_bulk, pending_rows)
+            self._users_with_pending.update(row[0] for row in pending_rows)
+
+            # 대상자에게 동시 전송 (세마포어로 동시 전송 수 제한 - 텔레그램 전역 한도 고려)
+            # 본문은 모든 사용자에게 동일하므로 루프 밖에서 1회만 렌더링
+            alert_body = self._build_drop_alert_body(current_level, nasdaq_info_for_alert,
+                                                     tqqq_info, scenarios)
+            semaphore = asyncio.Semaphore(25)
+
+            async def send_alert(user_id):
+                async with semaphore:
+                    try:
+                        success = await self.send_message_to_user(user_id, alert_body)
+                        if success:
+                            logger.info(f"사용자 {user_id} - 주가 하락 알림 전송 성공: {current_level}% 레벨")
+                            return user_id
                         logger.warning(f"사용자 {user_id} - 주가 알림 전송 실패, DB 업데이트 안 함 (다음에 재시도)")
-                    
-                    # 사용자 간 딜레이 (메시지 전송 간격 확보)
-                    await asyncio.sleep(1)
-                except Exception as e:
-                    logger.error(f"사용자 {user_id} - 주가 알림 처리 중 오류: {e}")
-                    import traceback
-                    logger.error(traceback.format_exc())
-            
+                    except Exception as e:
+                        logger.error(f"사용자 {user_id} - 주가 알림 처리 중 오류: {e}")
+                        logger.error(traceback.format_exc())
+                    return None
+
+            if eligible:
+                results = await asyncio.gather(*(send_alert(user_id) for user_id in eligible))
+                # 전송 성공한 사용자만 레벨 일괄 업데이트 (커밋 1회)
+                await asyncio.to_thread(
+                    self.db.update_stock_alert_levels_bulk,
+                    [(uid, current_level, ath_price, ath_date) for uid in results if uid is not None])
+
             logger.info("=== 주가 하락 알림 체크 완료 ===")
                 
         except Exception as e:
             logger.error(f"주가 하락 알림 체크 전체 오류: {e}")
-            import traceback
             logger.error(traceback.format_exc())
     
-    async def _send_drop_alert(self, user_id, drop_level, nasdaq_info):
-        """주가 하락 알림 전송 (전날 장중 최저가 기준)"""
-        # TQQQ 정보 가져오기 (동기 함수를 별도 스레드에서 실행)
-        tqqq_info = await asyncio.to_thread(self.stock_monitor.get_tqqq_info)
-        if not tqqq_info:
-            logger.warning(f"사용자 {user_id} - TQQQ 정보를 가져올 수 없어 알림 전송 실패")
-            return False
-        
-        # TQQQ 시나리오 계산
-        scenarios = self.stock_monitor.calculate_tqqq_scenarios(
-            nasdaq_info['current_price'],
-            nasdaq_info['all_time_high'],
-            tqqq_info['current_price']
+    def _build_drop_alert_body(self, drop_level, nasdaq_info, tqqq_info, scenarios):
+        """주가 하락 알림 본문 생성 (일괄 전송 시 사용자 수와 무관하게 1회만 호출)"""
+        return DROP_ALERT_TEMPLATE.format(
+            drop_level=drop_level,
+            current_price=nasdaq_info['current_price'],
+            low_time_str=nasdaq_info.get('low_time_str', '알 수 없음'),
+            all_time_high=nasdaq_info['all_time_high'],
+            ath_date_str=nasdaq_info['ath_date'].strftime('%Y-%m-%d'),
+            drop_percentage=nasdaq_info['drop_percentage'],
+            tqqq_price=tqqq_info['current_price'],
+            scenario_lines=format_scenario_lines(scenarios),
         )
-        
-        ath_date_str = nasdaq_info['ath_date'].strftime('%Y-%m-%d')
-        low_time_str = nasdaq_info.get('low_time_str', '알 수 없음')
-        
-        alert_message = f"""🚨 <b>나스닥 100 하락 알림</b> 🚨
 
-<b>⚠️ 전고점 대비 {drop_level}% 하락!</b>
+    async def _send_drop_alert(self, user_id, drop_level, nasdaq_info, tqqq_info=None, scenarios=None):
+        """주가 하락 알림 전송 (전날 장중 최저가 기준)
 
-<b>나스닥 100 (^NDX)</b>
-• 전날 장중 최저가: ${nasdaq_info['current_price']:,.2f} ({low_time_str})
-• 전고점: ${nasdaq_info['all_time_high']:,.2f} ({ath_date_str})
-• 하락률: ▼ {nasdaq_info['drop_percentage']:.2f}%
+        :param tqqq_info: 미리 조회한 TQQQ 정보 (없으면 직접 조회)
+        :param scenarios: 미리 계산한 TQQQ 시나리오 (없으면 직접 계산)
+        """
+        if tqqq_info is None:
+            # TQQQ 정보 가져오기 (동기 함수를 별도 스레드에서 실행)
+            tqqq_info = await asyncio.to_thread(self.stock_monitor.get_tqqq_info)
+            if not tqqq_info:
+                logger.warning(f"사용자 {user_id} - TQQQ 정보를 가져올 수 없어 알림 전송 실패")
+                return False
 
-<b>TQQQ</b>
-• 현재가: ${tqqq_info['current_price']:.2f}
+        if scenarios is None:
+            # TQQQ 시나리오 계산
+            scenarios = self.stock_monitor.calculate_tqqq_scenarios(
+                nasdaq_info['current_price'],
+                nasdaq_info['all_time_high'],
+                tqqq_info['current_price']
+            )
 
-<b>📉 나스닥 100 하락 시 (전고점 대비) TQQQ 예상가</b>
-<i>(20거래일 가정, 복리 계산)</i>
-• 10% 하락 시: ${scenarios[10]:.2f}
-• 15% 하락 시: ${scenarios[15]:.2f}
-• 20% 하락 시: ${scenarios[20]:.2f}
-• 25% 하락 시: ${scenarios[25]:.2f}
-• 30% 하락 시: ${scenarios[30]:.2f}
-• 35% 하락 시: ${scenarios[35]:.2f}
-• 40% 하락 시: ${scenarios[40]:.2f}
-• 45% 하락 시: ${scenarios[45]:.2f}
-• 50% 하락 시: ${scenarios[50]:.2f}
-"""
-        
+        alert_message = self._build_drop_alert_body(drop_level, nasdaq_info, tqqq_info, scenarios)
         success = await self.send_message_to_user(user_id, alert_message)
         if success:
             logger.info(f"사용자 {user_id} - 주가 하락 알림 전송 성공: {drop_level}% 레벨")
         return success
     
-    async def send_message_to_user(self, user_id, text, parse_mode='HTML'):
+    async def send_message_to_user(self, user_id, text, parse_mode=ParseMode.HTML):
         """특정 사용자에게 메시지 전송 (강화된 재시도 로직)"""
-        max_retries = 3  # 재시도 횟수
-        base_delay = 2  # 기본 대기 시간 (초)
-        
-        for attempt in range(max_retries):
-            try:
-                await self.application.bot.send_message(
-                    chat_id=user_id,
-                    text=text,
-                    parse_mode=parse_mode,
-                    disable_web_page_preview=True
-                )
-                
-                if attempt > 0:
-                    logger.info(f"✅ 사용자 {user_id} - 메시지 전송 성공 ({attempt + 1}번째 시도)")
-                
-                # 성공 시 짧은 딜레이 (텔레그램 API rate limiting 방지)
-                await asyncio.sleep(0.5)
-                return True
-                
-            except Exception as e:
-                error_str = str(e)
-                error_type = type(e).__name__
-                
-                # 사용자가 봇을 차단한 경우 - 재시도 불필요
-                if 'bot was blocked' in error_str or 'Forbidden' in error_type:
-                    self.db.add_blocked_user(user_id, 'bot_blocked')
-                    logger.warning(f"⚠️ 사용자 {user_id} - 봇 차단됨, DB에 차단 상태 저장")
-                    return False
-                
-                # 재시도 가능한 오류인지 확인
-                is_retryable_error = any(err in error_str or err in error_type for err in [
-                    'ConnectError', 'NetworkError', 'TimedOut', 'TimeoutError',
-                    'ConnectionError', 'ReadTimeout', 'ConnectTimeout',
-                    'RemoteDisconnected', 'BadGateway', 'ServiceUnavailable'
-                ])
-                
-                if attempt < max_retries - 1:
-                    if is_retryable_error:
-                        # 지수 백오프: 3초, 6초, 12초, 24초, 48초
-                        wait_time = base_delay * (2 ** attempt)
-                        logger.warning(f"🔄 사용자 {user_id} - 네트워크 오류, {wait_time}초 후 재시도 ({attempt + 1}/{max_retries})")
-                        logger.debug(f"   오류 상세: {error_type}: {error_str[:150]}")
-                        await asyncio.sleep(wait_time)
-                        continue
-                    else:
-                        # 재시도 불가능한 오류
-                        logger.error(f"❌ 사용자 {user_id} - 재시도 불가능한 오류: {error_type}: {error_str[:150]}")
-                        return False
-                else:
-                    # 최종 실패
-                    logger.error(f"❌ 사용자 {user_id} - 메시지 전송 최종 실패 ({max_retries}회 시도)")
-                    logger.error(f"   최종 오류: {error_type}: {error_str[:150]}")
-                    return False
-        
-        return False
+        def mark_blocked():
+            self.db.add_blocked_user(user_id, 'bot_blocked')
+            logger.warning(f"⚠️ 사용자 {user_id} - 봇 차단됨, DB에 차단 상태 저장")
+
+        return await self._send_with_retry(
+            lambda: self.application.bot.send_message(
+                chat_id=user_id,
+                text=text,
+                parse_mode=parse_mode,
+                disable_web_page_preview=True
+            ),
+            on_forbidden=mark_blocked
+        )
     
     async def send_message_html(self, text):
         """메시지 전송 (HTML 모드) - TELEGRAM_CHAT_ID 사용 (기존 호환성)"""
@@ -2137,7 +2067,7 @@ class TeleNewsBot:
                 await self.application.bot.send_message(
                     chat_id=TELEGRAM_CHAT_ID,
                     text=text,
-                    parse_mode='HTML',
+                    parse_mode=ParseMode.HTML,
                     disable_web_page_preview=True
                 )
         except Exception as e:
@@ -2145,28 +2075,24 @@ class TeleNewsBot:
     
     def setup_scheduler(self):
         """스케줄러 설정"""
+        # 공통 잡 기본값 (동시 실행 방지 + 누락된 작업 병합)
+        self.scheduler.configure(job_defaults={'coalesce': True, 'max_instances': 1})
+
         # 뉴스 체크 - 정각부터 10분 단위로
         self.scheduler.add_job(
             self.check_news_updates,
             'cron',
             minute='*/10',  # 0, 10, 20, 30, 40, 50분에 실행
             id='news_check',
-            max_instances=1,  # 동시 실행 방지
-            coalesce=True,    # 누락된 작업 병합
             misfire_grace_time=300  # 5분 이내 누락은 허용
         )
         logger.info("뉴스 체크 스케줄러 등록: 정각부터 10분 단위 (0, 10, 20, 30, 40, 50분)")
-        
+
         # 주가 체크 - 한국시간 오전 10시에 전날 장중 최저가 기준으로 확인
-        # CronTrigger를 사용하여 한국시간 기준으로 설정
-        from datetime import timezone, timedelta
-        kst = timezone(timedelta(hours=9))
         self.scheduler.add_job(
             self.check_stock_drop_alerts,
-            CronTrigger(hour=10, minute=0, timezone=kst),  # 한국시간 오전 10시
+            CronTrigger(hour=10, minute=0, timezone=KST),  # 한국시간 오전 10시
             id='stock_drop_check',
-            max_instances=1,  # 동시 실행 방지
-            coalesce=True,    # 누락된 작업 병합
             misfire_grace_time=600  # 10분 이내 누락은 허용
         )
         logger.info("주가 하락 알림 스케줄러 등록: 한국시간 오전 10시 (전날 장중 최저가 기준)")
@@ -2177,10 +2103,10 @@ class TeleNewsBot:
     async def error_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """에러 핸들러"""
         # 네트워크 오류는 재시도 로직이 처리하므로 간단히 로그만
-        error_str = str(context.error)
-        if 'ConnectError' in error_str or 'NetworkError' in error_str or 'TimedOut' in error_str:
+        # (httpx의 ConnectError/ReadTimeout 등은 PTB가 NetworkError/TimedOut으로 감싸서 전달)
+        if isinstance(context.error, (TimedOut, NetworkError)):
             # 네트워크 오류는 WARNING 레벨로 (재시도가 자동으로 처리됨)
-            logger.warning(f"네트워크 일시 오류 (자동 재시도 중)")
+            logger.warning("네트워크 일시 오류 (자동 재시도 중)")
         else:
             # 다른 오류는 ERROR 레벨로
             logger.error(f"업데이트 처리 중 오류 발생: {context.error}")
@@ -2192,21 +2118,42 @@ class TeleNewsBot:
             print("❌ .env 파일에 TELEGRAM_BOT_TOKEN을 설정해주세요.")
             return
         
+        # uvloop 사용 가능하면 이벤트 루프 교체 (네트워크 I/O 처리량 향상, 드롭인 대체)
+        try:
+            import uvloop
+            uvloop.install()
+            logger.info("uvloop 이벤트 루프 사용")
+        except ImportError:
+            pass
+
         # Application 생성 (네트워크 안정성 최적화)
         # 커스텀 HTTPXRequest로 연결 안정성 강화
+        # 발신용: HTTP/2 멀티플렉싱으로 소수의 keep-alive 연결에 동시 전송을 다중화
+        # (연결당 여러 요청이 실리므로 HTTP/1.1 때의 대형 풀이 필요 없음)
         request = HTTPXRequest(
-            connect_timeout=20.0,       # 연결 타임아웃 20초
+            connect_timeout=10.0,       # 연결 타임아웃 10초
             read_timeout=20.0,          # 읽기 타임아웃 20초
             write_timeout=20.0,         # 쓰기 타임아웃 20초
-            pool_timeout=20.0,          # 풀 타임아웃 20초
-            connection_pool_size=8      # 연결 풀 크기 (적절한 크기로 조정)
+            pool_timeout=8.0,           # 풀 타임아웃 8초
+            connection_pool_size=32,    # 연결 풀 크기 (HTTP/2 다중화 전제)
+            http_version="2"            # h2 패키지 필요 (requirements 포함)
         )
-        
+
+        # 수신용(getUpdates): 롱폴링은 한 번에 요청 1개만 날아가므로 최소 풀로 분리
+        # (전송 풀이 가득 차도 업데이트 수신이 막히지 않도록)
+        get_updates_request = HTTPXRequest(
+            connect_timeout=10.0,
+            read_timeout=20.0,      # PTB가 롱폴링 대기 시간을 여기에 더해서 사용
+            write_timeout=20.0,
+            pool_timeout=8.0,
+            connection_pool_size=2
+        )
+
         self.application = (
             Application.builder()
             .token(TELEGRAM_BOT_TOKEN)
             .request(request)
-            .get_updates_request(request)
+            .get_updates_request(get_updates_request)
             .build()
         )
         
@@ -2230,11 +2177,11 @@ class TeleNewsBot:
         # 에러 핸들러
         self.application.add_error_handler(self.error_handler)
         
-        # 스케줄러 설정
-        self.setup_scheduler()
-        
         # 명령어 메뉴 설정 (텔레그램 자동완성용 - 인자가 필요 없는 명령어만)
+        # 스케줄러도 여기서 시작 (AsyncIOScheduler는 실행 중인 이벤트 루프 위에서 시작해야
+        # 코루틴 잡이 스레드 핸드오프 없이 루프에 직접 등록됨)
         async def post_init(application: Application):
+            self.setup_scheduler()
             await application.bot.set_my_commands([
                 BotCommand("start", "봇 안내"),
                 BotCommand("add", "키워드 추가"),
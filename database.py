@@ -188,6 +188,39 @@ class Database:
         self.conn.commit()
         return deleted_count
     
+    def add_keywords(self, user_id, keywords):
+        """여러 키워드를 한 트랜잭션으로 추가
+
+        :return: (추가된 키워드 목록, 이미 등록되어 있던 키워드 목록) - 입력 순서 유지
+        """
+        try:
+            self.ensure_connection()
+            cursor = self.conn.cursor()
+            cursor.execute('SELECT keyword FROM keywords WHERE user_id = %s AND keyword = ANY(%s)',
+                           (user_id, list(keywords)))
+            existing = {row[0] for row in cursor.fetchall()}
+
+            added = []
+            already_exist = []
+            for keyword in keywords:
+                if keyword in existing or keyword in added:
+                    already_exist.append(keyword)
+                else:
+                    added.append(keyword)
+
+            if added:
+                cursor.executemany('INSERT INTO keywords (user_id, keyword) VALUES (%s, %s)',
+                                   [(user_id, keyword) for keyword in added])
+                self.conn.commit()
+            return added, already_exist
+        except Exception as e:
+            logger.error(f"키워드 일괄 추가 실패: {e}")
+            try:
+                self.conn.rollback()
+            except:
+                pass
+            return [], list(keywords)
+
     def get_keywords(self, user_id):
         """특정 사용자의 모든 키워드 조회 (추가 순서대로)"""
         cursor = self.conn.cursor()
@@ -207,17 +240,57 @@ class Database:
                       (user_id, keyword, url))
         return cursor.fetchone() is not None
     
+    def get_recent_sent_urls(self, user_id, keyword, days=7):
+        """최근 N일 내 전송된 URL 전체 조회 (인메모리 캐시 예열용)"""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT url FROM sent_news
+            WHERE user_id = %s AND keyword = %s
+              AND sent_at >= NOW() - INTERVAL '1 day' * %s
+        ''', (user_id, keyword, days))
+        return {row[0] for row in cursor.fetchall()}
+
+    def get_sent_urls(self, user_id, keyword, urls):
+        """이미 전송된 뉴스 URL들을 한 번의 쿼리로 조회 (개별 is_news_sent 호출 대체)"""
+        if not urls:
+            return set()
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT url FROM sent_news WHERE user_id = %s AND keyword = %s AND url = ANY(%s)',
+                      (user_id, keyword, list(urls)))
+        return {row[0] for row in cursor.fetchall()}
+
     def mark_news_sent(self, user_id, keyword, url, title):
         """뉴스를 전송완료로 표시"""
         try:
             cursor = self.conn.cursor()
-            cursor.execute('INSERT INTO sent_news (user_id, keyword, url, title) VALUES (%s, %s, %s, %s)', 
+            cursor.execute('INSERT INTO sent_news (user_id, keyword, url, title) VALUES (%s, %s, %s, %s)',
                          (user_id, keyword, url, title))
             self.conn.commit()
             return True
         except psycopg2.IntegrityError:
             self.conn.rollback()
             return False
+
+    def mark_news_sent_many(self, user_id, keyword, news_list):
+        """여러 뉴스를 한 번의 트랜잭션으로 전송완료 표시"""
+        if not news_list:
+            return True
+        try:
+            cursor = self.conn.cursor()
+            cursor.executemany('''
+                INSERT INTO sent_news (user_id, keyword, url, title)
+                VALUES (%s, %s, %s, %s)
+                ON CONFLICT (user_id, keyword, url) DO NOTHING
+            ''', [(user_id, keyword, news['url'], news['title']) for news in news_list])
+            self.conn.commit()
+            return True
+        except Exception as e:
+            logger.error(f"뉴스 전송 기록 일괄 저장 실패: {e}")
+            try:
+                self.conn.rollback()
+            except:
+                pass
+            return False
     
     def cleanup_old_news(self, days=7):
         """오래된 뉴스 기록 삭제 (기본 7일)"""
@@ -273,6 +346,18 @@ class Database:
             }
         return None
     
+    def get_last_stock_alert_levels(self, user_ids):
+        """여러 사용자의 마지막 주가 알림 레벨 일괄 조회 ({user_id: 레벨 정보})"""
+        if not user_ids:
+            return {}
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT user_id, last_alert_level, ath_price, ath_date
+            FROM stock_alert_levels WHERE user_id = ANY(%s)
+        ''', (list(user_ids),))
+        return {row[0]: {'last_level': row[1], 'ath_price': row[2], 'ath_date': row[3]}
+                for row in cursor.fetchall()}
+
     def update_stock_alert_level(self, user_id, level, ath_price, ath_date):
         """주가 알림 레벨 업데이트"""
         cursor = self.conn.cursor()
@@ -288,6 +373,23 @@ class Database:
         ''', (user_id, level, ath_price, ath_date))
         self.conn.commit()
     
+    def update_stock_alert_levels_bulk(self, rows):
+        """주가 알림 레벨 일괄 업데이트 (rows: (user_id, level, ath_price, ath_date), 커밋 1회)"""
+        if not rows:
+            return
+        cursor = self.conn.cursor()
+        cursor.executemany('''
+            INSERT INTO stock_alert_levels
+            (user_id, last_alert_level, last_alert_time, ath_price, ath_date)
+            VALUES (%s, %s, CURRENT_TIMESTAMP, %s, %s)
+            ON CONFLICT (user_id) DO UPDATE SET
+                last_alert_level = EXCLUDED.last_alert_level,
+                last_alert_time = CURRENT_TIMESTAMP,
+                ath_price = EXCLUDED.ath_price,
+                ath_date = EXCLUDED.ath_date
+        ''', rows)
+        self.conn.commit()
+
     def get_all_users(self):
         """모든 사용자 ID 조회 (키워드가 있는 사용자)"""
         cursor = self.conn.cursor()
@@ -321,6 +423,20 @@ class Database:
             }
         return None
     
+    def get_quiet_hours_bulk(self, user_ids):
+        """여러 사용자의 방해금지 시간 일괄 조회 (설정 없는 사용자는 None)"""
+        if not user_ids:
+            return {}
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT user_id, start_time, end_time, enabled
+            FROM quiet_hours WHERE user_id = ANY(%s)
+        ''', (list(user_ids),))
+        settings = {uid: None for uid in user_ids}
+        for row in cursor.fetchall():
+            settings[row[0]] = {'start_time': row[1], 'end_time': row[2], 'enabled': row[3]}
+        return settings
+
     def disable_quiet_hours(self, user_id):
         """방해금지 시간 비활성화"""
         cursor = self.conn.cursor()
@@ -358,6 +474,41 @@ class Database:
         ''', (user_id, alert_level, ath_price, ath_date, nasdaq_json))
         self.conn.commit()
     
+    def set_pending_stock_alerts_bulk(self, rows):
+        """대기 주가 알림 일괄 저장 (커밋 1회)
+
+        rows: (user_id, alert_level, ath_price, ath_date, nasdaq_info) 튜플 리스트
+        """
+        if not rows:
+            return
+        cursor = self.conn.cursor()
+        params = []
+        for user_id, alert_level, ath_price, ath_date, nasdaq_info in rows:
+            nasdaq_json = json.dumps({
+                'current_price': nasdaq_info['current_price'],
+                'all_time_high': nasdaq_info['all_time_high'],
+                'drop_percentage': nasdaq_info['drop_percentage'],
+                'ath_date': nasdaq_info['ath_date'].strftime('%Y-%m-%d') if hasattr(nasdaq_info['ath_date'], 'strftime') else nasdaq_info['ath_date']
+            })
+            params.append((user_id, alert_level, ath_price, ath_date, nasdaq_json))
+        cursor.executemany('''
+            INSERT INTO pending_stock_alerts
+            (user_id, alert_level, ath_price, ath_date, nasdaq_info)
+            VALUES (%s, %s, %s, %s, %s)
+            ON CONFLICT (user_id) DO UPDATE SET
+                alert_level = EXCLUDED.alert_level,
+                ath_price = EXCLUDED.ath_price,
+                ath_date = EXCLUDED.ath_date,
+                nasdaq_info = EXCLUDED.nasdaq_info
+        ''', params)
+        self.conn.commit()
+
+    def get_pending_alert_user_ids(self):
+        """대기 중인 주가 알림이 있는 사용자 ID 목록 (인메모리 집합 초기화용)"""
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT user_id FROM pending_stock_alerts')
+        return [row[0] for row in cursor.fetchall()]
+
     def get_pending_stock_alert(self, user_id):
         """사용자의 대기 중인 주가 알림 가져오기"""
         cursor = self.conn.cursor()
@@ -393,6 +544,18 @@ class Database:
             # 기본값: True (활성화)
             return True
     
+    def get_nasdaq_alert_settings(self, user_ids):
+        """여러 사용자의 나스닥 알림 설정 일괄 조회 (기록 없으면 기본값 True)"""
+        if not user_ids:
+            return {}
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT user_id, enabled FROM nasdaq_alert_settings WHERE user_id = ANY(%s)',
+                       (list(user_ids),))
+        settings = {uid: True for uid in user_ids}
+        for row in cursor.fetchall():
+            settings[row[0]] = row[1]
+        return settings
+
     def set_nasdaq_alert_setting(self, user_id, enabled):
         """나스닥 알림 설정 저장/업데이트"""
         cursor = self.conn.cursor()
@@ -461,6 +624,25 @@ class Database:
             logger.error(f"차단된 사용자 확인 실패: {e}")
             return False
     
+    def get_all_user_keywords_grouped(self):
+        """차단되지 않은 사용자의 키워드를 사용자별로 그룹화하여 조회 (등록 순서 유지)"""
+        try:
+            self.ensure_connection()
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                SELECT k.user_id, array_agg(k.keyword ORDER BY k.id)
+                FROM keywords k
+                LEFT JOIN blocked_users b ON k.user_id = b.user_id
+                WHERE b.user_id IS NULL
+                GROUP BY k.user_id
+            ''')
+            result = {row[0]: row[1] for row in cursor.fetchall()}
+            cursor.close()
+            return result
+        except Exception as e:
+            logger.error(f"사용자별 키워드 그룹 조회 실패: {e}")
+            return {}
+
     def get_all_user_keywords_except_blocked(self):
         """차단되지 않은 사용자의 키워드만 조회"""
         try:
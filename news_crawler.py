@@ -10,6 +10,25 @@ import logging
 from datetime import datetime, timedelta
 from config import NAVER_CLIENT_ID, NAVER_CLIENT_SECRET
 from difflib import SequenceMatcher
+from functools import lru_cache
+
+# 제목 정규화/비교용 패턴 (호출마다 컴파일하지 않도록 모듈 레벨에 1회)
+_TAG_RE = re.compile(r'<[^>]+>')
+_NON_WORD_RE = re.compile(r'[^\w\s가-힣]')
+
+
+@lru_cache(maxsize=10_000)
+def _normalize_title(title):
+    """유사도 비교용 제목 정규화 (같은 기사가 사용자/주기마다 반복되므로 결과 캐시)"""
+    cleaned = _TAG_RE.sub('', title)
+    return _NON_WORD_RE.sub('', cleaned).strip().lower()
+
+
+@lru_cache(maxsize=10_000)
+def _title_similarity(norm1, norm2):
+    """정규화된 제목 쌍의 유사도 (같은 기사 쌍이 반복 비교되므로 결과 캐시)"""
+    return SequenceMatcher(None, norm1, norm2).ratio()
+
 
 def clean_text(text):
     """HTML 태그를 안전하게 처리하는 함수"""
@@ -95,6 +114,10 @@ class NaverNewsCrawler:
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
         self._consecutive_failures = 0
+        # 뉴스 검색 결과 캐시 (짧은 TTL - 같은 키워드 연속 조회 시 API 호출 생략)
+        self._news_cache = {}  # {(keyword, count): (저장 시각, 결과)}
+        self._news_cache_ttl = 90  # 초
+        self._news_cache_maxsize = 512
 
     def _safe_get(self, url, *, headers=None, params=None, timeout=(10, 20)):
         """세션으로 GET 요청을 안전하게 수행 (재시도 + 세션 리셋)"""
@@ -288,16 +311,8 @@ class NaverNewsCrawler:
     
     def calculate_similarity(self, title1, title2):
         """두 제목의 유사도 계산 (0.0 ~ 1.0)"""
-        # HTML 태그 제거
-        title1_clean = re.sub(r'<[^>]+>', '', title1)
-        title2_clean = re.sub(r'<[^>]+>', '', title2)
-        
-        # 특수문자 및 공백 정규화
-        title1_norm = re.sub(r'[^\w\s가-힣]', '', title1_clean).strip().lower()
-        title2_norm = re.sub(r'[^\w\s가-힣]', '', title2_clean).strip().lower()
-        
-        # SequenceMatcher로 유사도 계산
-        return SequenceMatcher(None, title1_norm, title2_norm).ratio()
+        # 정규화와 비교 결과 모두 캐시 (같은 기사가 사용자/주기마다 다시 비교됨)
+        return _title_similarity(_normalize_title(title1), _normalize_title(title2))
     
     def filter_similar_news(self, news_list, similarity_threshold=0.75):
         """유사한 뉴스를 필터링하여 대표 뉴스만 반환 (유사 개수 포함)"""
@@ -782,5 +797,25 @@ class NaverNewsCrawler:
         :param last_check_count: 확인할 최신 뉴스 개수 (기본 10개 = 네이버 첫 페이지)
         :return: 뉴스 리스트
         """
-        return self.search_news(keyword, max_results=last_check_count)
+        # 캐시 확인 (TTL 이내면 API 호출 없이 재사용)
+        cache_key = (keyword, last_check_count)
+        cached = self._news_cache.get(cache_key)
+        if cached and time.time() - cached[0] < self._news_cache_ttl:
+            logger.debug(f"뉴스 캐시 사용: '{keyword}' ({last_check_count}개)")
+            return cached[1]
+
+        news_list = self.search_news(keyword, max_results=last_check_count)
+
+        # 성공한 결과만 캐시에 저장 (오류로 빈 리스트가 온 경우는 다음에 재시도)
+        if news_list:
+            if len(self._news_cache) >= self._news_cache_maxsize:
+                # 만료된 항목 정리 (가득 찼을 때만)
+                now = time.time()
+                self._news_cache = {
+                    k: v for k, v in self._news_cache.items()
+                    if now - v[0] < self._news_cache_ttl
+                }
+            self._news_cache[cache_key] = (time.time(), news_list)
+
+        return news_list
 
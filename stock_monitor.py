@@ -5,6 +5,17 @@ import pandas as pd
 import requests
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
+# 시나리오 하락률 단계 (전고점 대비 %) - 계산과 메시지 렌더링이 같은 표를 공유
+SCENARIO_LEVELS = (10, 15, 20, 25, 30, 35, 40, 45, 50)
+
+
+def format_scenario_lines(scenarios):
+    """시나리오 dict를 '• N% 하락 시: $가격' 줄 목록으로 변환"""
+    return '\n'.join(
+        f'• {drop}% 하락 시: ${scenarios[drop]:.2f}' for drop in SCENARIO_LEVELS
+    )
+
+
 class StockMonitor:
     def __init__(self):
         self.nasdaq_ticker = "^NDX"  # 나스닥 100 지수
@@ -415,7 +426,7 @@ class StockMonitor:
             50: 2.00   # 50% 하락 시 (추정)
         }
         
-        for drop in [10, 15, 20, 25, 30, 35, 40, 45, 50]:
+        for drop in SCENARIO_LEVELS:
             # 전고점 대비 drop% 하락한 나스닥 가격
             target_nasdaq = nasdaq_ath * (1 - drop / 100)
             
@@ -485,15 +496,7 @@ class StockMonitor:
 • 현재가: ${tqqq_info['current_price']:.2f}
 
 <b>📉 나스닥 하락 시 (전고점 대비) TQQQ 예상가</b>
-• 10% 하락 시: ${scenarios[10]:.2f}
-• 15% 하락 시: ${scenarios[15]:.2f}
-• 20% 하락 시: ${scenarios[20]:.2f}
-• 25% 하락 시: ${scenarios[25]:.2f}
-• 30% 하락 시: ${scenarios[30]:.2f}
-• 35% 하락 시: ${scenarios[35]:.2f}
-• 40% 하락 시: ${scenarios[40]:.2f}
-• 45% 하락 시: ${scenarios[45]:.2f}
-• 50% 하락 시: ${scenarios[50]:.2f}
+{format_scenario_lines(scenarios)}
 
 ──────────────
 